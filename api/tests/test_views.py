@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -22,30 +24,31 @@ from base.models import (
 class BaseAPITestCase(APITestCase):
     """Base test case class with common setup methods."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create test users
-        self.teacher = User.objects.create_user(
+        cls.teacher = User.objects.create_user(
             username="teacher1",
             email="teacher1@example.com",
             password="testpass123",
             role=User.Role.TEACHER,
         )
 
-        self.teacher2 = User.objects.create_user(
+        cls.teacher2 = User.objects.create_user(
             username="teacher2",
             email="teacher2@example.com",
             password="testpass123",
             role=User.Role.TEACHER,
         )
 
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             username="student1",
             email="student1@example.com",
             password="testpass123",
             role=User.Role.STUDENT,
         )
 
-        self.student2 = User.objects.create_user(
+        cls.student2 = User.objects.create_user(
             username="student2",
             email="student2@example.com",
             password="testpass123",
@@ -53,22 +56,22 @@ class BaseAPITestCase(APITestCase):
         )
 
         # Create test classroom
-        self.classroom = Classroom.objects.create(
-            name="Test Classroom", teacher=self.teacher
+        cls.classroom = Classroom.objects.create(
+            name="Test Classroom", teacher=cls.teacher
         )
-        self.classroom.students.add(self.student)
+        cls.classroom.students.add(cls.student)
 
         # Create test quiz
-        self.quiz = Quiz.objects.create(
+        cls.quiz = Quiz.objects.create(
             title="Test Quiz",
-            classroom=self.classroom,
+            classroom=cls.classroom,
             is_active=True,
             allowed_attempts=2,
         )
 
         # Create test questions
-        self.question1 = Question.objects.create(
-            quiz=self.quiz,
+        cls.question1 = Question.objects.create(
+            quiz=cls.quiz,
             text="What is 2+2?",
             has_multiple_answers=False,
             is_written=False,
@@ -76,8 +79,8 @@ class BaseAPITestCase(APITestCase):
             order=1,
         )
 
-        self.question2 = Question.objects.create(
-            quiz=self.quiz,
+        cls.question2 = Question.objects.create(
+            quiz=cls.quiz,
             text="Select all prime numbers",
             has_multiple_answers=True,
             is_written=False,
@@ -85,24 +88,24 @@ class BaseAPITestCase(APITestCase):
         )
 
         # Create test answers
-        self.answer1 = Answer.objects.create(
-            question=self.question1, text="4", is_correct=True
+        cls.answer1 = Answer.objects.create(
+            question=cls.question1, text="4", is_correct=True
         )
 
-        self.answer2 = Answer.objects.create(
-            question=self.question1, text="3", is_correct=False
+        cls.answer2 = Answer.objects.create(
+            question=cls.question1, text="3", is_correct=False
         )
 
-        self.answer3 = Answer.objects.create(
-            question=self.question2, text="2", is_correct=True
+        cls.answer3 = Answer.objects.create(
+            question=cls.question2, text="2", is_correct=True
         )
 
-        self.answer4 = Answer.objects.create(
-            question=self.question2, text="3", is_correct=True
+        cls.answer4 = Answer.objects.create(
+            question=cls.question2, text="3", is_correct=True
         )
 
-        self.answer5 = Answer.objects.create(
-            question=self.question2, text="4", is_correct=False
+        cls.answer5 = Answer.objects.create(
+            question=cls.question2, text="4", is_correct=False
         )
 
 
@@ -158,6 +161,16 @@ class ClassroomViewSetTests(BaseAPITestCase):
         self.assertEqual(len(response.data[0]["students"]), 1)
         self.assertEqual(response.data[0]["students"][0]["id"], self.student.id)
 
+    def test_student_count_is_not_limited_by_student_filter(self):
+        """Test student_count covers the whole classroom for a student user."""
+        self.classroom.students.add(self.student2)
+        self.client.force_authenticate(user=self.student)
+
+        response = self.client.get("/api/classrooms/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["student_count"], 2)
+
     def test_teacher_can_retrieve_classroom(self):
         """Test that teachers can retrieve their classroom."""
         self.client.force_authenticate(user=self.teacher)
@@ -292,6 +305,17 @@ class QuizViewSetTests(BaseAPITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["id"], self.quiz.id)
 
+    def test_list_quizzes_includes_question_count(self):
+        """Test quiz list reports question counts from the annotation."""
+        Quiz.objects.create(title="Empty Quiz", classroom=self.classroom)
+        self.client.force_authenticate(user=self.teacher)
+
+        response = self.client.get("/api/quizzes/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {quiz["title"]: quiz["question_count"] for quiz in response.data}
+        self.assertEqual(counts, {"Test Quiz": 2, "Empty Quiz": 0})
+
     def test_filter_quizzes_by_classroom(self):
         """Test filtering quizzes by classroom."""
         self.client.force_authenticate(user=self.teacher)
@@ -302,6 +326,21 @@ class QuizViewSetTests(BaseAPITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["classroom"], self.classroom.id)
 
+    def test_update_cannot_move_quiz_to_other_classroom(self):
+        """Test that a quiz update ignores a new classroom."""
+        other_classroom = Classroom.objects.create(
+            name="Other Classroom", teacher=self.teacher
+        )
+        self.client.force_authenticate(user=self.teacher)
+        data = {"title": "Renamed Quiz", "classroom": other_classroom.id}
+
+        response = self.client.patch(f"/api/quizzes/{self.quiz.id}/", data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.quiz.refresh_from_db()
+        self.assertEqual(self.quiz.title, "Renamed Quiz")
+        self.assertEqual(self.quiz.classroom, self.classroom)
+
     def test_invalid_classroom_filter_returns_empty(self):
         """Test filtering with invalid classroom ID returns empty queryset."""
         self.client.force_authenticate(user=self.teacher)
@@ -311,10 +350,36 @@ class QuizViewSetTests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 0)
 
+    def test_superscript_digit_classroom_filter_returns_empty(self):
+        """Test a non-decimal digit such as "²" in the filter returns empty queryset."""
+        self.client.force_authenticate(user=self.teacher)
+
+        response = self.client.get("/api/quizzes/?classroom=²")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 0)
+
 
 class QuestionViewSetTests(BaseAPITestCase):
     """Tests for QuestionViewSet."""
 
+    def test_list_questions_query_count_does_not_grow_with_questions(self):
+        """Test that listing questions prefetches answers instead of one query each."""
+        self.client.force_authenticate(user=self.teacher)
+
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get("/api/questions/")
+
+        extra = Question.objects.create(quiz=self.quiz, text="Extra?")
+        Answer.objects.create(question=extra, text="Yes", is_correct=True)
+
+        with CaptureQueriesContext(connection) as grown:
+            response = self.client.get("/api/questions/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(grown), len(baseline))
+
     def test_teacher_can_create_question(self):
         """Test that teachers can create questions."""
         self.client.force_authenticate(user=self.teacher)
@@ -385,6 +450,19 @@ class QuestionViewSetTests(BaseAPITestCase):
         for question in response.data:
             self.assertEqual(question["quiz"], self.quiz.id)
 
+    def test_update_cannot_move_question_to_other_quiz(self):
+        """Test that a question update ignores a new quiz."""
+        other_quiz = Quiz.objects.create(title="Other Quiz", classroom=self.classroom)
+        self.client.force_authenticate(user=self.teacher)
+        data = {"text": "What is 2+3?", "quiz": other_quiz.id}
+
+        response = self.client.patch(f"/api/questions/{self.question1.id}/", data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.question1.refresh_from_db()
+        self.assertEqual(self.question1.text, "What is 2+3?")
+        self.assertEqual(self.question1.quiz, self.quiz)
+
     def test_invalid_quiz_filter_returns_empty(self):
         """Test filtering with invalid quiz ID returns empty queryset."""
         self.client.force_authenticate(user=self.teacher)
@@ -394,6 +472,15 @@ class QuestionViewSetTests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 0)
 
+    def test_empty_quiz_filter_is_ignored(self):
+        """Test an empty quiz filter param does not filter questions."""
+        self.client.force_authenticate(user=self.teacher)
+
+        response = self.client.get("/api/questions/?quiz=")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
 
 class AnswerViewSetTests(BaseAPITestCase):
     """Tests for AnswerViewSet."""
@@ -455,6 +542,18 @@ class AnswerViewSetTests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 5)  # answer1-5
 
+    def test_update_cannot_move_answer_to_other_question(self):
+        """Test that an answer update ignores a new question."""
+        self.client.force_authenticate(user=self.teacher)
+        data = {"text": "Four", "question": self.question2.id}
+
+        response = self.client.patch(f"/api/answers/{self.answer1.id}/", data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.answer1.refresh_from_db()
+        self.assertEqual(self.answer1.text, "Four")
+        self.assertEqual(self.answer1.question, self.question1)
+
     def test_student_cannot_list_answers(self):
         """Test that students cannot list answers (teacher only)."""
         self.client.force_authenticate(user=self.student)
@@ -689,19 +788,35 @@ class StudentQuizAttemptViewSetTests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["id"], attempt.id)
+        self.assertEqual(response.data[0]["quiz"], self.quiz.id)
+        self.assertEqual(response.data[0]["quiz_name"], self.quiz.title)
+        self.assertEqual(response.data[0]["student"], self.student.id)
+
+    def test_archived_attempts_excludes_other_students(self):
+        """Test archived attempts only include the requesting student's own."""
+        StudentQuizAttempt.objects.create(student=self.student, quiz=self.quiz)
+        self.classroom.students.remove(self.student)
+
+        self.client.force_authenticate(user=self.student2)
+
+        response = self.client.get("/api/attempts/archived/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 0)
 
 
 class StudentAnswerSubmitViewSetTests(BaseAPITestCase):
     """Tests for StudentAnswerSubmitViewSet."""
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Create a quiz attempt and question attempt for testing
-        self.attempt = StudentQuizAttempt.objects.create(
-            student=self.student, quiz=self.quiz
+        cls.attempt = StudentQuizAttempt.objects.create(
+            student=cls.student, quiz=cls.quiz
         )
-        self.question_attempt = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.attempt, question=self.question1
+        cls.question_attempt = StudentQuestionAttempt.objects.create(
+            quiz_attempt=cls.attempt, question=cls.question1
         )
 
     def test_student_can_submit_answer(self):
@@ -718,6 +833,16 @@ class StudentAnswerSubmitViewSetTests(BaseAPITestCase):
         self.question_attempt.refresh_from_db()
         self.assertIsNotNone(self.question_attempt.submitted_at)
 
+    def test_student_cannot_submit_without_answers(self):
+        """Test that a submission without answers is rejected."""
+        self.client.force_authenticate(user=self.student)
+        data = {"question_attempt": self.question_attempt.id}
+
+        response = self.client.post("/api/answer-submit/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("answers", response.data)
+
     def test_student_cannot_submit_answer_for_nonexistent_attempt(self):
         """Test submitting answer for nonexistent question attempt."""
         self.client.force_authenticate(user=self.student)
@@ -800,9 +925,10 @@ class StudentAnswerSubmitViewSetTests(BaseAPITestCase):
 class EnrollmentCodeViewSetTests(BaseAPITestCase):
     """Tests for EnrollmentCodeViewSet."""
 
-    def setUp(self):
-        super().setUp()
-        self.enrollment_code = EnrollmentCode.generate_for_class(self.classroom)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enrollment_code = EnrollmentCode.generate_for_class(cls.classroom)
 
     def test_teacher_can_retrieve_enrollment_code(self):
         """Test that teachers can retrieve enrollment code for their classroom."""
@@ -852,15 +978,16 @@ class EnrollmentCodeViewSetTests(BaseAPITestCase):
 class EnrollViewTests(BaseAPITestCase):
     """Tests for EnrollView."""
 
-    def setUp(self):
-        super().setUp()
-        self.enrollment_code = EnrollmentCode.generate_for_class(self.classroom)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enrollment_code = EnrollmentCode.generate_for_class(cls.classroom)
         # Create a classroom without the test student
-        self.other_classroom = Classroom.objects.create(
-            name="Other Classroom", teacher=self.teacher2
+        cls.other_classroom = Classroom.objects.create(
+            name="Other Classroom", teacher=cls.teacher2
         )
-        self.other_enrollment_code = EnrollmentCode.generate_for_class(
-            self.other_classroom
+        cls.other_enrollment_code = EnrollmentCode.generate_for_class(
+            cls.other_classroom
         )
 
     def test_student_can_enroll_with_valid_code(self):
@@ -920,46 +1047,47 @@ class EnrollViewTests(BaseAPITestCase):
 class TeacherStudentQuizAttemptsStatsViewSetTests(BaseAPITestCase):
     """Tests for TeacherStudentQuizAttemptsStatsViewSet."""
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Add student2 to classroom for testing multiple students
-        self.classroom.students.add(self.student2)
+        cls.classroom.students.add(cls.student2)
 
         # Create quiz attempts for testing
-        self.attempt1 = StudentQuizAttempt.objects.create(
-            student=self.student,
-            quiz=self.quiz,
+        cls.attempt1 = StudentQuizAttempt.objects.create(
+            student=cls.student,
+            quiz=cls.quiz,
             completed_at=timezone.now(),
             score=Decimal("85.50"),
         )
 
-        self.attempt2 = StudentQuizAttempt.objects.create(
-            student=self.student2,
-            quiz=self.quiz,
+        cls.attempt2 = StudentQuizAttempt.objects.create(
+            student=cls.student2,
+            quiz=cls.quiz,
             completed_at=timezone.now(),
             score=Decimal("92.00"),
         )
 
         # Create question attempts for testing detailed stats
-        self.question_attempt1 = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.attempt1,
-            question=self.question1,
+        cls.question_attempt1 = StudentQuestionAttempt.objects.create(
+            quiz_attempt=cls.attempt1,
+            question=cls.question1,
             submitted_at=timezone.now(),
         )
 
-        self.question_attempt2 = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.attempt1,
-            question=self.question2,
+        cls.question_attempt2 = StudentQuestionAttempt.objects.create(
+            quiz_attempt=cls.attempt1,
+            question=cls.question2,
             submitted_at=timezone.now(),
         )
 
         # Create student answers for testing
-        self.student_answer1 = StudentAnswer.objects.create(
-            question_attempt=self.question_attempt1, text="4", is_correct=True
+        cls.student_answer1 = StudentAnswer.objects.create(
+            question_attempt=cls.question_attempt1, text="4", is_correct=True
         )
 
-        self.student_answer2 = StudentAnswer.objects.create(
-            question_attempt=self.question_attempt2, text="2", is_correct=True
+        cls.student_answer2 = StudentAnswer.objects.create(
+            question_attempt=cls.question_attempt2, text="2", is_correct=True
         )
 
     def test_teacher_can_list_quiz_attempts_stats(self):
@@ -983,6 +1111,25 @@ class TeacherStudentQuizAttemptsStatsViewSetTests(BaseAPITestCase):
         self.assertIn("id", attempt_data["student"])
         self.assertIn("username", attempt_data["student"])
 
+    def test_list_stats_query_count_does_not_grow_with_attempts(self):
+        """Test that listing stats joins students instead of one query each."""
+        self.client.force_authenticate(user=self.teacher)
+        url = f"/api/quiz/{self.quiz.id}/stats/"
+
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(url)
+
+        extra_student = User.objects.create_user(
+            username="extra_student", password="testpass123", role=User.Role.STUDENT
+        )
+        StudentQuizAttempt.objects.create(student=extra_student, quiz=self.quiz)
+
+        with CaptureQueriesContext(connection) as grown:
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(grown), len(baseline))
+
     def test_teacher_cannot_access_other_teachers_quiz_stats(self):
         """Test that teachers cannot access stats for other teachers' quizzes."""
         other_classroom = Classroom.objects.create(
@@ -5,9 +5,10 @@ from drf_spectacular.utils import extend_schema
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 from django import shortcuts
-from django.db.models import OuterRef, Subquery, Exists
+from django.db.models import OuterRef, Subquery, Exists, Count, Q
 
 from base.permissions import IsTeacher, IsStudent
+from base.membership import is_enrolled
 from base import serializers as base_srlzs
 from base.models import (
     User,
@@ -22,6 +23,26 @@ from base.models import (
 )
 
 
+class ForeignKeyParamFilterMixin:
+    """
+    Checks the foreign key ids named in ``filterset_fields`` before filtering.
+
+    A malformed id yields an empty result up front. Well-formed ids go through
+    the configured filter backends, and an unknown one also yields an empty
+    result.
+    """
+
+    def filter_queryset(self, queryset):
+        for field in self.filterset_fields:
+            value = self.request.query_params.get(field)
+            if value and not value.isdecimal():
+                return queryset.none()
+        try:
+            return super().filter_queryset(queryset)
+        except ValidationError:
+            return queryset.none()
+
+
 @extend_schema(tags=["Classroom"])
 class ClassroomViewSet(viewsets.ModelViewSet):
     queryset = Classroom.objects.all()
@@ -43,11 +64,14 @@ class ClassroomViewSet(viewsets.ModelViewSet):
         EnrollmentCode.generate_for_class(classroom)
 
     def get_queryset(self):
-        qs = super().get_queryset()
-        if self.request.user.role == User.Role.TEACHER:
-            return qs.filter(teacher=self.request.user)
-        elif self.request.user.role == User.Role.STUDENT:
-            return qs.filter(students=self.request.user)
+        user = self.request.user
+        qs = base_srlzs.ClassroomSerializer.setup_queryset(super().get_queryset(), user)
+        if user.role == User.Role.TEACHER:
+            # Plain column filter, teachers never pay for the students join.
+            return qs.filter(teacher_id=user.id)
+        elif user.role == User.Role.STUDENT:
+            # (classroom, user) pairs are unique, so no DISTINCT is needed.
+            return qs.filter(students__id=user.id)
 
     @action(detail=True, methods=["post"], url_path="delete-students")
     def delete_students(self, request, pk=None):
@@ -72,17 +96,16 @@ class ClassroomViewSet(viewsets.ModelViewSet):
 
 
 @extend_schema(tags=["Quiz"])
-class QuizViewSet(viewsets.ModelViewSet):
+class QuizViewSet(ForeignKeyParamFilterMixin, viewsets.ModelViewSet):
     queryset = Quiz.objects.all()
     serializer_class = base_srlzs.QuizSerializer
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ["classroom"]
 
-    def filter_queryset(self, queryset):
-        try:
-            return super().filter_queryset(queryset)
-        except ValidationError as e:
-            return queryset.none()
+    def get_serializer_class(self):
+        if self.action in ["update", "partial_update"]:
+            return base_srlzs.QuizUpdateSerializer
+        return super().get_serializer_class()
 
     def get_permissions(self):
         if self.action not in ["list", "retrieve", "quizzes_by_classroom"]:
@@ -90,7 +113,7 @@ class QuizViewSet(viewsets.ModelViewSet):
         return super().get_permissions()
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        qs = base_srlzs.QuizSerializer.setup_queryset(super().get_queryset())
         if self.request.user.role == User.Role.TEACHER:
             classrooms = Classroom.objects.filter(teacher=self.request.user)
         elif self.request.user.role == User.Role.STUDENT:
@@ -115,17 +138,16 @@ class QuizViewSet(viewsets.ModelViewSet):
 
 
 @extend_schema(tags=["Question"])
-class QuestionViewSet(viewsets.ModelViewSet):
+class QuestionViewSet(ForeignKeyParamFilterMixin, viewsets.ModelViewSet):
     queryset = Question.objects.all()
     serializer_class = base_srlzs.QuestionSerializer
     permission_classes = [permissions.IsAuthenticated, IsTeacher]
     filterset_fields = ["quiz"]
 
-    def filter_queryset(self, queryset):
-        try:
-            return super().filter_queryset(queryset)
-        except ValidationError as e:
-            return queryset.none()
+    def get_serializer_class(self):
+        if self.action in ["update", "partial_update"]:
+            return base_srlzs.QuestionUpdateSerializer
+        return super().get_serializer_class()
 
     # def get_permissions(self):
     #     if self.action not in ["retrieve"]:
@@ -133,7 +155,7 @@ class QuestionViewSet(viewsets.ModelViewSet):
     #     return super().get_permissions()
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        qs = base_srlzs.QuestionSerializer.setup_queryset(super().get_queryset())
         return qs.filter(quiz__classroom__teacher=self.request.user)
 
     def create(self, request, *args, **kwargs):
@@ -155,17 +177,16 @@ class QuestionViewSet(viewsets.ModelViewSet):
 
 
 @extend_schema(tags=["Answer"])
-class AnswerViewSet(viewsets.ModelViewSet):
+class AnswerViewSet(ForeignKeyParamFilterMixin, viewsets.ModelViewSet):
     queryset = Answer.objects.all()
     serializer_class = base_srlzs.AnswerSerializer
     permission_classes = [permissions.IsAuthenticated, IsTeacher]
     filterset_fields = ["question"]
 
-    def filter_queryset(self, queryset):
-        try:
-            return super().filter_queryset(queryset)
-        except ValidationError as e:
-            return queryset.none()
+    def get_serializer_class(self):
+        if self.action in ["update", "partial_update"]:
+            return base_srlzs.AnswerUpdateSerializer
+        return super().get_serializer_class()
 
     # def get_permissions(self):
     #     if self.action not in ["retrieve"]:
@@ -196,6 +217,7 @@ class AnswerViewSet(viewsets.ModelViewSet):
 
 @extend_schema(tags=["Student Quiz Attempt"])
 class StudentQuizAttemptViewSet(
+    ForeignKeyParamFilterMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -206,45 +228,50 @@ class StudentQuizAttemptViewSet(
     permission_classes = [permissions.IsAuthenticated, IsStudent]
     filterset_fields = ["quiz"]
 
-    def filter_queryset(self, queryset):
-        try:
-            return super().filter_queryset(queryset)
-        except ValidationError as e:
-            return queryset.none()
-
     def get_queryset(self):
-        return super().get_queryset().filter(student=self.request.user)
+        qs = base_srlzs.StudentQuizAttemptSerializer.setup_queryset(
+            super().get_queryset()
+        )
+        return qs.filter(student=self.request.user)
 
     def create(self, request, *args, **kwargs):
         quiz_id = request.data.get("quiz")
-        try:
-            quiz = Quiz.objects.get(id=quiz_id, is_active=True)
-        except Quiz.DoesNotExist:
+        # Only a few columns are needed for the checks below, so skip
+        # building a full Quiz instance.
+        quiz = (
+            Quiz.objects.filter(id=quiz_id, is_active=True)
+            .values("id", "allowed_attempts", "classroom_id")
+            .first()
+        )
+        if quiz is None:
             return Response(
                 {"detail": "Quiz does not exist."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        attempts = StudentQuizAttempt.objects.filter(student=request.user, quiz=quiz)
+        attempts = StudentQuizAttempt.objects.filter(
+            student=request.user, quiz_id=quiz["id"]
+        ).aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(completed_at__isnull=True)),
+        )
 
-        if attempts.filter(completed_at__isnull=True).exists():
+        if attempts["active"]:
             return Response(
                 {"detail": "You already have an active attempt for this quiz."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if quiz.classroom.students.filter(id=request.user.id).exists():
-            attempts_count = attempts.count()
-            if attempts_count >= quiz.allowed_attempts:
-                return Response(
-                    {"detail": "You have reached the maximum allowed attempts."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            return super().create(request, *args, **kwargs)
-        else:
+        if not is_enrolled(request.user.id, quiz["classroom_id"]):
             return Response(
                 {"detail": "You are not enrolled in this quiz's classroom."},
                 status=status.HTTP_403_FORBIDDEN,
             )
+        if attempts["total"] >= quiz["allowed_attempts"]:
+            return Response(
+                {"detail": "You have reached the maximum allowed attempts."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer):
         serializer.save(student=self.request.user)
@@ -252,6 +279,8 @@ class StudentQuizAttemptViewSet(
     def get_serializer_class(self):
         if self.action == "next_question":
             return base_srlzs.SQANextQuestionSerializer
+        if self.action == "archived":
+            return base_srlzs.ArchivedAttemptSerializer
         return base_srlzs.StudentQuizAttemptSerializer
 
     @extend_schema(
@@ -276,9 +305,20 @@ class StudentQuizAttemptViewSet(
         )
 
         # Select attempts where that match doesn't exist
-        archived_quiz_attempts = StudentQuizAttempt.objects.annotate(
-            is_in_classroom=Exists(classroom_students)
-        ).filter(is_in_classroom=False)
+        archived_quiz_attempts = (
+            self.get_queryset()
+            .annotate(is_in_classroom=Exists(classroom_students))
+            .filter(is_in_classroom=False)
+            .values(
+                "id",
+                "student_id",
+                "quiz_id",
+                "started_at",
+                "completed_at",
+                "score",
+                "quiz__title",
+            )
+        )
         serializer = self.get_serializer(archived_quiz_attempts, many=True)
         return Response(serializer.data)
 
@@ -290,17 +330,20 @@ class StudentAnswerSubmitViewSet(generics.CreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsStudent]
 
     def create(self, request, *args, **kwargs):
-        question_attempt_id = request.data.get("question_attempt")
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        question_attempt_id = serializer.validated_data["question_attempt"]
+        answers = serializer.validated_data["answers"]
         try:
-            question_attempt = StudentQuestionAttempt.objects.get(
-                id=question_attempt_id
-            )
+            question_attempt = StudentQuestionAttempt.objects.select_related(
+                "question", "quiz_attempt"
+            ).get(id=question_attempt_id)
         except StudentQuestionAttempt.DoesNotExist:
             return Response(
                 {"detail": "Question attempt does not exist."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if question_attempt.quiz_attempt.student != self.request.user:
+        if question_attempt.quiz_attempt.student_id != self.request.user.id:
             return Response(
                 {"detail": "Question attempt does not exist."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -310,9 +353,7 @@ class StudentAnswerSubmitViewSet(generics.CreateAPIView):
                 {"detail": "This question attempt has already been completed."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if (not question_attempt.question.has_multiple_answers) and len(
-            request.data.get("answers")
-        ) > 1:
+        if (not question_attempt.question.has_multiple_answers) and len(answers) > 1:
             return Response(
                 {"detail": "This question allows only one answer."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -321,13 +362,7 @@ class StudentAnswerSubmitViewSet(generics.CreateAPIView):
         question_attempt.submitted_at = timezone.now()
         question_attempt.save()
 
-        student_answers = []
-        for answer_text in request.data.get("answers"):
-            answer = StudentAnswer(question_attempt=question_attempt, text=answer_text)
-            answer.is_correct = answer._calculate_correctness()
-            student_answers.append(answer)
-
-        StudentAnswer.objects.bulk_create(student_answers)
+        serializer.save(question_attempt=question_attempt)
 
         return Response(
             {"detail": "Answers submitted successfully."},
@@ -375,7 +410,7 @@ class EnrollView(generics.CreateAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if enrollment_code.classroom.students.filter(id=request.user.id).exists():
+        if is_enrolled(request.user.id, enrollment_code.classroom_id):
             return Response(
                 {"detail": "You are already enrolled in this classroom."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -399,11 +434,10 @@ class TeacherStudentQuizAttemptsStatsViewSet(
 
     def get_queryset(self):
         quiz_id = self.kwargs.get("id")
-        return (
-            super()
-            .get_queryset()
-            .filter(quiz__id=quiz_id, quiz__classroom__teacher=self.request.user)
+        qs = base_srlzs.TeacherStudentQuizAttemptStatsSerializer.setup_queryset(
+            super().get_queryset()
         )
+        return qs.filter(quiz__id=quiz_id, quiz__classroom__teacher=self.request.user)
 
     def get_serializer_class(self):
         if self.action == "stats_by_quiz_attempt":
@@ -422,11 +456,8 @@ class TeacherStudentQuizAttemptsStatsViewSet(
             )
 
         question_attempts = (
-            StudentQuestionAttempt.objects.filter(quiz_attempt=quiz_attempt)
-            .select_related("question__quiz")
-            .prefetch_related(
-                "question__answers",
-                "student_answers",
+            base_srlzs.TeacherStudentQuestionAttemptStatsSerializer.setup_queryset(
+                StudentQuestionAttempt.objects.filter(quiz_attempt=quiz_attempt)
             )
         )
         serializer = self.get_serializer(
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 from .models import (
@@ -67,10 +68,24 @@ class CustomUserAdmin(UserAdmin):
 class ClassroomAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "teacher", "student_count")
     list_display_links = ("name",)
+    list_select_related = ("teacher",)
     list_filter = ("teacher",)
     search_fields = ("name", "teacher__username")
     filter_horizontal = ("students",)
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(_student_count=Count("students", distinct=True))
+        )
+
+    def student_count(self, obj):
+        return obj._student_count
+
+    student_count.short_description = "Student count"
+    student_count.admin_order_field = "_student_count"
+
 
 @admin.register(Quiz)
 class QuizAdmin(admin.ModelAdmin):
@@ -82,6 +97,7 @@ class QuizAdmin(admin.ModelAdmin):
         "allowed_attempts",
     )
     list_display_links = ("title",)
+    list_select_related = ("classroom",)
     list_filter = ("classroom", "is_active")
     search_fields = ("title", "classroom__name")
     readonly_fields = ("created_at",)
@@ -99,6 +115,7 @@ class QuestionAdmin(admin.ModelAdmin):
         "time_limit",
     )
     list_display_links = ("text",)
+    list_select_related = ("quiz",)
     list_filter = ("quiz", "has_multiple_answers", "is_written")
     search_fields = ("text",)
     # readonly_fields = ("order",)
@@ -108,6 +125,7 @@ class QuestionAdmin(admin.ModelAdmin):
 class AnswerAdmin(admin.ModelAdmin):
     list_display = ("id", "text", "question", "is_correct")
     list_display_links = ("text",)
+    list_select_related = ("question",)
     list_filter = ("question__quiz", "is_correct")
     search_fields = ("text",)
 
@@ -116,6 +134,7 @@ class AnswerAdmin(admin.ModelAdmin):
 class StudentQuizAttemptAdmin(admin.ModelAdmin):
     list_display = ("id", "student", "quiz", "score")
     list_display_links = ("student", "quiz")
+    list_select_related = ("student", "quiz")
     list_filter = ("quiz", "student")
     search_fields = ("student__username", "quiz__title")
     readonly_fields = ("started_at", "completed_at", "score")
@@ -125,6 +144,7 @@ class StudentQuizAttemptAdmin(admin.ModelAdmin):
 class StudentQuestionAttemptAdmin(admin.ModelAdmin):
     list_display = ("id", "question", "quiz_attempt", "time_taken_in_seconds")
     list_display_links = ("question",)
+    list_select_related = ("question", "quiz_attempt")
     list_filter = ("quiz_attempt__quiz", "question")
     search_fields = ("quiz_attempt__student__username", "question__text")
     readonly_fields = ("started_at",)  # add completed_at
@@ -142,6 +162,10 @@ class StudentQuestionAttemptAdmin(admin.ModelAdmin):
 class StudentAnswerAdmin(admin.ModelAdmin):
     list_display = ("id", "text", "question_attempt", "is_correct")
     list_display_links = ("text",)
+    list_select_related = (
+        "question_attempt__question",
+        "question_attempt__quiz_attempt__student",
+    )
     list_filter = ("is_correct",)
     search_fields = ("text", "question_attempt__question__text")
     readonly_fields = ("is_correct",)
@@ -151,6 +175,7 @@ class StudentAnswerAdmin(admin.ModelAdmin):
 class EnrollmentCodeAdmin(admin.ModelAdmin):
     list_display = ("id", "code", "classroom", "is_active")
     list_display_links = ("code",)
+    list_select_related = ("classroom",)
     list_filter = ("classroom", "is_active")
     search_fields = ("code", "classroom__name")
     readonly_fields = ("code",)
@@ -0,0 +1,8 @@
+from base.models import Classroom
+
+
+def is_enrolled(user_id, classroom_id):
+    """Return whether the user is a student of the given classroom."""
+    return Classroom.students.through.objects.filter(
+        classroom_id=classroom_id, user_id=user_id
+    ).exists()
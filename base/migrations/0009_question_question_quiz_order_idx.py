@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0008_alter_user_email"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["quiz", "order"], name="question_quiz_order_idx"
+            ),
+        ),
+    ]
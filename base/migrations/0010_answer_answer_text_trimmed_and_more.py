@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0009_question_question_quiz_order_idx"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="answer",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("text__regex", "^\\s|\\s$"), _negated=True),
+                name="answer_text_trimmed",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="studentanswer",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("text__regex", "^\\s|\\s$"), _negated=True),
+                name="studentanswer_text_trimmed",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:48
+
+from django.db import migrations, models
+
+
+def backfill_text_normalized(apps, schema_editor):
+    # Lowercase in Python, matching Answer.save, rather than with SQL LOWER()
+    # whose Unicode handling differs between backends.
+    Answer = apps.get_model("base", "Answer")
+    answers = list(Answer.objects.only("id", "text"))
+    for answer in answers:
+        answer.text_normalized = answer.text.lower()
+    Answer.objects.bulk_update(answers, ["text_normalized"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0010_answer_answer_text_trimmed_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="answer",
+            name="text_normalized",
+            field=models.CharField(default="", editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_text_normalized, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(
+                condition=models.Q(("is_correct", True)),
+                fields=["question", "text_normalized"],
+                name="answer_correct_text_idx",
+            ),
+        ),
+    ]
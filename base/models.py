@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 from datetime import timedelta
 from django.utils import timezone
@@ -75,14 +76,17 @@ class Question(models.Model):
     is_written = models.BooleanField(default=False)
     time_limit = models.PositiveIntegerField(null=True, blank=True)  # in seconds
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["quiz", "order"], name="question_quiz_order_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         if self.pk is None and self.order is None:
-            max_order = Question.objects.filter(quiz=self.quiz).aggregate(
+            max_order = Question.objects.filter(quiz_id=self.quiz_id).aggregate(
                 models.Max("order")
             )["order__max"]
             self.order = (max_order or 0) + 1
-        # else:
-        #     self.order = Quiz.objects.get(id=self.quiz.id).questions.count() + 1
         super().save(*args, **kwargs)
 
     def get_correct_answers(self):
@@ -92,23 +96,78 @@ class Question(models.Model):
         return f"{self.id}. {self.text[:50]}"
 
 
+class AnswerQuerySet(models.QuerySet):
+    """
+    Keeps text_normalized current on the bulk paths that skip Answer.save().
+
+    Text is not stripped here; the answer_text_trimmed constraint rejects
+    padded text that did not go through save().
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for answer in objs:
+            answer.text_normalized = (answer.text or "").lower()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if "text" in fields:
+            objs = list(objs)
+            for answer in objs:
+                answer.text_normalized = (answer.text or "").lower()
+            fields = [*fields, "text_normalized"]
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        if "text" in kwargs:
+            text = kwargs["text"]
+            if isinstance(text, str):
+                kwargs["text_normalized"] = text.lower()
+            else:
+                # An expression can only be lowercased by the database.
+                kwargs["text_normalized"] = Lower(text)
+        return super().update(**kwargs)
+
+
 class Answer(models.Model):
     question = models.ForeignKey(
         Question, on_delete=models.CASCADE, related_name="answers"
     )
     text = models.CharField(max_length=255)
+    # Lowercased copy of text, compared exactly when checking student answers.
+    # Must always equal text.lower(): save() and every AnswerQuerySet write
+    # path set it, so raw SQL that changes text has to set it too.
+    text_normalized = models.CharField(max_length=255, editable=False, default="")
     is_correct = models.BooleanField(default=False)
 
+    objects = AnswerQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         if self.text:
             self.text = self.text.strip()
+        self.text_normalized = (self.text or "").lower()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "text" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "text_normalized"}
         super().save(*args, **kwargs)
 
     class Meta:
         constraints = [
             models.UniqueConstraint(
                 fields=["question", "text"], name="unique_answer_per_question"
-            )
+            ),
+            models.CheckConstraint(
+                # Same whitespace str.strip() removes, not only spaces.
+                condition=~models.Q(text__regex=r"^\s|\s$"),
+                name="answer_text_trimmed",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["question", "text_normalized"],
+                condition=models.Q(is_correct=True),
+                name="answer_correct_text_idx",
+            ),
         ]
 
     def __str__(self):
@@ -128,11 +187,16 @@ class StudentQuizAttempt(models.Model):
     score = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True)
 
     def get_next_question(self):
-        attempted_ids = self.question_attempts.filter(
-            submitted_at__isnull=False
-        ).values_list("question_id", flat=True)
+        submitted = StudentQuestionAttempt.objects.filter(
+            quiz_attempt=self,
+            question=models.OuterRef("pk"),
+            submitted_at__isnull=False,
+        )
         return (
-            self.quiz.questions.exclude(id__in=attempted_ids).order_by("order").first()
+            Question.objects.filter(quiz_id=self.quiz_id)
+            .exclude(models.Exists(submitted))
+            .order_by("order")
+            .first()
         )
 
     def __str__(self):
@@ -197,7 +261,11 @@ class StudentAnswer(models.Model):
     text = models.CharField(max_length=255)
     is_correct = models.BooleanField(default=False)
 
-    def _calculate_correctness(self):
+    def _calculate_correctness(self, correct_texts=None):
+        """
+        ``correct_texts`` is an optional set of lowercased correct answer
+        texts, precomputed once when checking several answers together.
+        """
         if self.text:
             self.text = self.text.strip()
 
@@ -209,11 +277,13 @@ class StudentAnswer(models.Model):
         ):
             return False
         else:
-            return (
-                self.question_attempt.question.get_correct_answers()
-                .filter(text__iexact=self.text)
-                .exists()
-            )
+            if correct_texts is not None:
+                return self.text.lower() in correct_texts
+            return Answer.objects.filter(
+                question_id=self.question_attempt.question_id,
+                is_correct=True,
+                text_normalized=self.text.lower(),
+            ).exists()
 
     def save(self, *args, **kwargs):
         self.is_correct = self._calculate_correctness()
@@ -224,7 +294,12 @@ class StudentAnswer(models.Model):
             models.UniqueConstraint(
                 fields=["question_attempt", "text"],
                 name="unique_StudentAnswer_per_StudentQuestionAttempt",
-            )
+            ),
+            models.CheckConstraint(
+                # Same whitespace str.strip() removes, not only spaces.
+                condition=~models.Q(text__regex=r"^\s|\s$"),
+                name="studentanswer_text_trimmed",
+            ),
         ]
 
     def clean(self):
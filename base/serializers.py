@@ -1,6 +1,11 @@
+from functools import cached_property
+
 from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
 from djoser.serializers import UserCreateSerializer
 from drf_spectacular.utils import extend_schema_field
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch
 
 from base.models import (
     User,
@@ -14,6 +19,10 @@ from base.models import (
     EnrollmentCode,
 )
 
+DUPLICATE_ANSWER_MESSAGE = (
+    "An answer with this text already exists for the selected question."
+)
+
 
 class CustomUserCreateSerializer(UserCreateSerializer):
     email = serializers.EmailField(required=True)
@@ -29,6 +38,14 @@ class CustomUserCreateSerializer(UserCreateSerializer):
         return value
 
 
+class StudentRequestMixin:
+    """Resolves the requesting user's role once per serializer instance."""
+
+    @cached_property
+    def _is_student(self):
+        return self.context.get("request").user.role == User.Role.STUDENT
+
+
 class BaseUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -39,25 +56,52 @@ class BaseUserSerializer(serializers.ModelSerializer):
         }
 
 
-class ClassroomSerializer(serializers.ModelSerializer):
+class ClassroomSerializer(StudentRequestMixin, serializers.ModelSerializer):
     teacher = BaseUserSerializer(read_only=True)
-    students = BaseUserSerializer(many=True, read_only=True)
+    students = serializers.SerializerMethodField()
     student_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Classroom
         fields = ["id", "name", "teacher", "students", "student_count"]
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        user = self.context.get("request").user
-        if user.role == User.Role.STUDENT:
-            representation["students"] = [
-                student
-                for student in representation["students"]
-                if student["id"] == user.id
-            ]
-        return representation
+    @classmethod
+    def setup_queryset(cls, queryset, user=None):
+        # N+1 guard: teacher (FK) is joined, students (M2M) are prefetched and
+        # student_count is annotated. Instances without the annotation fall
+        # back to Classroom.student_count(), one COUNT each. Students only
+        # ever see themselves, so their prefetch is narrowed to their own row.
+        # Users are loaded with just the columns BaseUserSerializer renders.
+        user_fields = BaseUserSerializer.Meta.fields
+        students = User.objects.only(*user_fields)
+        if user is not None and user.role == User.Role.STUDENT:
+            students = Prefetch(
+                "students",
+                queryset=students.filter(pk=user.pk),
+                to_attr="visible_students",
+            )
+        else:
+            students = Prefetch("students", queryset=students)
+        return (
+            queryset.select_related("teacher")
+            .only("name", "teacher", *(f"teacher__{field}" for field in user_fields))
+            .prefetch_related(students)
+            .annotate(student_count=Count("students", distinct=True))
+        )
+
+    @extend_schema_field(BaseUserSerializer(many=True))
+    def get_students(self, obj):
+        if self._is_student:
+            students = getattr(obj, "visible_students", None)
+            if students is None:
+                students = obj.students.filter(pk=self.context.get("request").user.pk)
+        else:
+            students = obj.students.all()
+        # BaseUserSerializer only renders plain columns, so read them straight
+        # off the prefetched users instead of running a serializer per row.
+        # .values() would bypass the prefetch and query once per classroom.
+        fields = BaseUserSerializer.Meta.fields
+        return [{field: getattr(user, field) for field in fields} for user in students]
 
 
 class ClassroomDeleteStudentsSerializer(serializers.Serializer):
@@ -69,74 +113,65 @@ class ClassroomDeleteStudentsSerializer(serializers.Serializer):
         fields = ["student_ids"]
 
 
-class AnswerSerializer(serializers.ModelSerializer):
-    def validate(self, attrs):
-        question = attrs.get("question", getattr(self.instance, "question", None))
-        text = attrs.get("text", getattr(self.instance, "text", None))
-        qs = Answer.objects.filter(question=question, text=text)
-        if self.instance:
-            qs = qs.exclude(pk=self.instance.pk)
-        if qs.exists():
-            raise serializers.ValidationError(
-                {
-                    "text": "An answer with this text already exists for the selected question."
-                }
-            )
-        return attrs
-
+class AnswerSerializer(StudentRequestMixin, serializers.ModelSerializer):
     def validate_text(self, value):
+        # Strip before the uniqueness validator runs against the stored text.
         if value:
             value = value.strip()
-
-        # Get the question from the request data
-        request = self.context.get("request")
-        if request and hasattr(request, "data"):
-            question_id = request.data.get("question")
-            if question_id:
-                try:
-                    question = Question.objects.get(pk=question_id)
-
-                    qs = Answer.objects.filter(question=question, text=value)
-                    if self.instance:
-                        qs = qs.exclude(pk=self.instance.pk)
-
-                    if qs.exists():
-                        raise serializers.ValidationError(
-                            "An answer with this text already exists for the selected question."
-                        )
-                except Question.DoesNotExist:
-                    pass
-
         return value
 
-    question = serializers.PrimaryKeyRelatedField(queryset=Question.objects.all())
+    question = serializers.PrimaryKeyRelatedField(queryset=Question.objects.only("id"))
 
     class Meta:
         model = Answer
         fields = ["id", "question", "text", "is_correct"]
+        validators = [
+            UniqueTogetherValidator(
+                queryset=Answer.objects.all(),
+                fields=["question", "text"],
+                message=DUPLICATE_ANSWER_MESSAGE,
+            )
+        ]
+
+    def run_validators(self, value):
+        # Report the unique-together failure on the text field, matching the
+        # IntegrityError fallback below.
+        try:
+            super().run_validators(value)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({"text": exc.detail})
+
+    def create(self, validated_data):
+        # The validator's SELECT can race a concurrent insert; the unique
+        # constraint is the final arbiter.
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({"text": DUPLICATE_ANSWER_MESSAGE})
 
     def update(self, instance, validated_data):
         validated_data.pop("question", None)
-        return super().update(instance, validated_data)
-
-    def get_fields(self):
-        fields = super().get_fields()
-        action = self.context.get("view").action if self.context.get("view") else None
-        if action in ["update", "partial_update"]:
-            fields["question"].read_only = True
-        return fields
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({"text": DUPLICATE_ANSWER_MESSAGE})
 
     def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        user = self.context.get("request").user
-        if user.role == User.Role.STUDENT:
-            representation = {"text": representation["text"]}
-        return representation
+        if self._is_student:
+            # Students only see the text, skip rendering the other fields.
+            return {"text": instance.text}
+        return super().to_representation(instance)
 
 
-class QuestionSerializer(serializers.ModelSerializer):
-    answers = AnswerSerializer(many=True, read_only=True)
-    quiz = serializers.PrimaryKeyRelatedField(queryset=Quiz.objects.all())
+class AnswerUpdateSerializer(AnswerSerializer):
+    question = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
+class QuestionSerializer(StudentRequestMixin, serializers.ModelSerializer):
+    answers = serializers.SerializerMethodField()
+    quiz = serializers.PrimaryKeyRelatedField(queryset=Quiz.objects.only("id"))
 
     class Meta:
         model = Question
@@ -158,28 +193,30 @@ class QuestionSerializer(serializers.ModelSerializer):
         validated_data.pop("quiz", None)
         return super().update(instance, validated_data)
 
-    def get_fields(self):
-        fields = super().get_fields()
-        action = self.context.get("view").action if self.context.get("view") else None
-        if action in ["update", "partial_update"]:
-            fields["quiz"].read_only = True
-        return fields
+    @classmethod
+    def setup_queryset(cls, queryset):
+        # N+1 guard: answers (reverse FK) are prefetched.
+        return queryset.prefetch_related("answers")
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        user = self.context.get("request").user
-        if user.role == User.Role.STUDENT:
-            if representation["is_written"] == True:
-                representation["answers"] = None
-            else:
-                representation["answers"] = [
-                    answer["text"] for answer in representation["answers"]
-                ]
-        return representation
+    @extend_schema_field(AnswerSerializer(many=True))
+    def get_answers(self, obj):
+        # Students only ever see the option texts, so skip the nested
+        # serializer for them.
+        if self._is_student:
+            if obj.is_written:
+                return None
+            return [answer.text for answer in obj.answers.all()]
+        return AnswerSerializer(obj.answers.all(), many=True, context=self.context).data
+
+
+class QuestionUpdateSerializer(QuestionSerializer):
+    quiz = serializers.PrimaryKeyRelatedField(read_only=True)
 
 
 class QuizSerializer(serializers.ModelSerializer):
-    classroom = serializers.PrimaryKeyRelatedField(queryset=Classroom.objects.all())
+    classroom = serializers.PrimaryKeyRelatedField(
+        queryset=Classroom.objects.only("id")
+    )
     question_count = serializers.IntegerField(read_only=True)
 
     class Meta:
@@ -195,16 +232,19 @@ class QuizSerializer(serializers.ModelSerializer):
             "question_count",
         ]
 
+    @classmethod
+    def setup_queryset(cls, queryset):
+        # N+1 guard: question_count is annotated. Instances without the
+        # annotation fall back to Quiz.question_count(), one COUNT each.
+        return queryset.annotate(question_count=Count("questions"))
+
     def update(self, instance, validated_data):
         validated_data.pop("classroom", None)
         return super().update(instance, validated_data)
 
-    def get_fields(self):
-        fields = super().get_fields()
-        action = self.context.get("view").action if self.context.get("view") else None
-        if action in ["update", "partial_update"]:
-            fields["classroom"].read_only = True
-        return fields
+
+class QuizUpdateSerializer(QuizSerializer):
+    classroom = serializers.PrimaryKeyRelatedField(read_only=True)
 
 
 class StudentAnswerSerializer(serializers.ModelSerializer):
@@ -219,27 +259,44 @@ class StudentAnswersSubmitSerializer(serializers.Serializer):
     answers = serializers.ListField(child=serializers.CharField(), allow_empty=False)
 
     def create(self, validated_data):
-        pass
+        # The view looks up and checks the attempt, then passes the instance
+        # via save(question_attempt=...).
+        question_attempt = validated_data["question_attempt"]
 
-    # def create(self, validated_data):
-    #     question_attempt_id = validated_data.pop("question_attempt")
-    #     answers_data = validated_data.pop("answers")
+        correct_texts = set(
+            question_attempt.question.get_correct_answers().values_list(
+                "text_normalized", flat=True
+            )
+        )
+        # A repeated answer is stored once. Compare stripped texts, as saved,
+        # so "Paris" and " Paris" count as the same answer.
+        answer_texts = dict.fromkeys(text.strip() for text in validated_data["answers"])
+        student_answers = []
+        for answer_text in answer_texts:
+            answer = StudentAnswer(question_attempt=question_attempt, text=answer_text)
+            answer.is_correct = answer._calculate_correctness(correct_texts)
+            student_answers.append(answer)
 
-    #     student_answers = []
+        return StudentAnswer.objects.bulk_create(student_answers)
 
-    #     for answer_data in answers_data:
-    #         answer = StudentAnswer.objects.create(
-    #             question_attempt=question_attempt_id,
-    #             text=answer_data
-    #         )
-    #         student_answers.append(answer)
 
-    #     return student_answers
+class QuestionSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Question
+        fields = [
+            "id",
+            "order",
+            "text",
+            "has_multiple_answers",
+            "is_written",
+            "time_limit",
+        ]
+        read_only_fields = fields
 
 
 class StudentQuestionAttemptSerializer(serializers.ModelSerializer):
     student_answers = StudentAnswerSerializer(many=True, read_only=True)
-    question = QuestionSerializer(read_only=True)
+    question = QuestionSummarySerializer(read_only=True)
 
     class Meta:
         model = StudentQuestionAttempt
@@ -273,6 +330,23 @@ class StudentQuizAttemptSerializer(serializers.ModelSerializer):
             "completed_at": {"read_only": True},
         }
 
+    @classmethod
+    def setup_queryset(cls, queryset):
+        # N+1 guard: quiz (FK) is joined for quiz_name.
+        return queryset.select_related("quiz")
+
+
+class ArchivedAttemptSerializer(serializers.Serializer):
+    """Read-only rows built from a ``.values()`` projection of attempts."""
+
+    id = serializers.IntegerField(read_only=True)
+    student = serializers.IntegerField(source="student_id", read_only=True)
+    quiz = serializers.IntegerField(source="quiz_id", read_only=True)
+    started_at = serializers.DateTimeField(read_only=True)
+    completed_at = serializers.DateTimeField(read_only=True)
+    score = serializers.DecimalField(max_digits=5, decimal_places=2, read_only=True)
+    quiz_name = serializers.CharField(source="quiz__title", read_only=True)
+
 
 class SQANextQuestionSerializer(serializers.ModelSerializer):
     next_question = serializers.SerializerMethodField()
@@ -286,26 +360,45 @@ class SQANextQuestionSerializer(serializers.ModelSerializer):
             "next_question",
         ]
 
-    def get_question_and_attempt(self, obj):
+    @cached_property
+    def _next_question_cache(self):
+        # Both method fields ask for the same lookup, so cache it per attempt.
+        # Keyed by pk because a many=True list shares one child serializer.
+        return {}
+
+    @cached_property
+    def _question_data_cache(self):
+        # Attempts at the same quiz often land on the same question, render
+        # each question once per serializer.
+        return {}
 
-        if hasattr(self, "_cached_next_question_data"):
-            return self._cached_next_question_data
+    def get_question_and_attempt(self, obj):
+        cache = self._next_question_cache
+        if obj.pk in cache:
+            return cache[obj.pk]
 
         question = obj.get_next_question()
+        attempt = None
         if question:
-            attempt, _ = StudentQuestionAttempt.objects.get_or_create(
+            # get_or_create is a single SELECT when the student is resuming an
+            # attempt, and still handles concurrent creates via the unique
+            # constraint. Only the id is rendered.
+            attempt, _ = StudentQuestionAttempt.objects.only("id").get_or_create(
                 quiz_attempt=obj, question=question
             )
-            self._cached_next_question_data = (question, attempt)
-            return question, attempt
-        return None, None
+        # Cache the finished case too.
+        cache[obj.pk] = (question, attempt)
+        return question, attempt
 
     @extend_schema_field(QuestionSerializer)
     def get_next_question(self, obj):
         question, _ = self.get_question_and_attempt(obj)
-        if question:
-            return QuestionSerializer(question, context=self.context).data
-        return None
+        if question is None:
+            return None
+        cache = self._question_data_cache
+        if question.pk not in cache:
+            cache[question.pk] = QuestionSerializer(question, context=self.context).data
+        return cache[question.pk]
 
     @extend_schema_field(serializers.IntegerField)
     def get_question_attempt(self, obj):
@@ -359,6 +452,11 @@ class TeacherStudentQuizAttemptStatsSerializer(serializers.ModelSerializer):
         fields = ["id", "student", "started_at", "completed_at", "score"]
         read_only_fields = ["id", "student", "started_at", "completed_at"]
 
+    @classmethod
+    def setup_queryset(cls, queryset):
+        # N+1 guard: student (FK) is joined for the nested user.
+        return queryset.select_related("student")
+
 
 class TeacherStudentQuestionAttemptStatsSerializer(serializers.ModelSerializer):
     question = QuestionSerializer(read_only=True)
@@ -374,3 +472,11 @@ class TeacherStudentQuestionAttemptStatsSerializer(serializers.ModelSerializer):
             "student_answers",
         ]
         read_only_fields = ["id", "started_at", "submitted_at"]
+
+    @classmethod
+    def setup_queryset(cls, queryset):
+        # N+1 guard: question (FK) is joined; its answers and the student's
+        # answers (reverse FKs) are prefetched.
+        return queryset.select_related("question").prefetch_related(
+            "question__answers", "student_answers"
+        )
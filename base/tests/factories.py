@@ -0,0 +1,56 @@
+"""Shared fixture builders for the base test suite.
+
+Each builder creates the parent objects it needs when they are not passed
+in, so a test only spells out what it cares about. Users get an unusable
+password unless one is given, which skips hashing.
+"""
+
+from django.test import TestCase
+
+from base.models import User, Classroom, Quiz, Question
+
+
+def create_teacher(username="teacher", **kwargs):
+    kwargs.setdefault("email", f"{username}@example.com")
+    return User.objects.create_user(username=username, role=User.Role.TEACHER, **kwargs)
+
+
+def create_student(username="student", **kwargs):
+    kwargs.setdefault("email", f"{username}@example.com")
+    return User.objects.create_user(username=username, role=User.Role.STUDENT, **kwargs)
+
+
+def create_classroom(teacher=None, name="Math"):
+    if teacher is None:
+        teacher = create_teacher()
+    return Classroom.objects.create(name=name, teacher=teacher)
+
+
+def create_quiz(classroom=None, title="Quiz 1", **kwargs):
+    if classroom is None:
+        classroom = create_classroom()
+    return Quiz.objects.create(title=title, classroom=classroom, **kwargs)
+
+
+def create_question(quiz=None, text="Test Question", **kwargs):
+    if quiz is None:
+        quiz = create_quiz()
+    return Question.objects.create(quiz=quiz, text=text, **kwargs)
+
+
+class ClassroomFixtureTestCase(TestCase):
+    """Provides a teacher and their classroom."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = create_teacher()
+        cls.classroom = create_classroom(cls.teacher)
+
+
+class QuizFixtureTestCase(ClassroomFixtureTestCase):
+    """Adds a quiz in the teacher's classroom."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.quiz = create_quiz(cls.classroom)
@@ -0,0 +1,26 @@
+from ..membership import is_enrolled
+from .factories import create_student, ClassroomFixtureTestCase
+
+
+class MembershipTests(ClassroomFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+
+    def test_is_enrolled_with_student_not_in_classroom(self):
+        """Test is_enrolled returns False for a student outside the classroom"""
+        self.assertFalse(is_enrolled(self.student.id, self.classroom.id))
+
+    def test_is_enrolled_with_student_in_classroom(self):
+        """Test is_enrolled returns True for an enrolled student"""
+        self.classroom.students.add(self.student)
+
+        self.assertTrue(is_enrolled(self.student.id, self.classroom.id))
+
+    def test_is_enrolled_runs_one_query(self):
+        """Test is_enrolled checks the through table without loading the classroom"""
+        self.classroom.students.add(self.student)
+
+        with self.assertNumQueries(1):
+            is_enrolled(self.student.id, self.classroom.id)
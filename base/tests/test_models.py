@@ -1,9 +1,12 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from decimal import Decimal
+import string
 from datetime import timedelta
-from django.db import IntegrityError
+from operator import attrgetter
+from unittest.mock import patch
+from django.db import IntegrityError, transaction
 from ..models import (
     User,
     Classroom,
@@ -15,6 +18,16 @@ from ..models import (
     StudentAnswer,
     EnrollmentCode,
 )
+from .factories import (
+    create_teacher,
+    create_student,
+    create_classroom,
+    create_question,
+    ClassroomFixtureTestCase,
+    QuizFixtureTestCase,
+)
+
+ENROLLMENT_CODE_CHARS = frozenset(string.ascii_uppercase + string.digits)
 
 
 class UserModelTest(TestCase):
@@ -37,18 +50,6 @@ class UserModelTest(TestCase):
         self.assertTrue(teacher.check_password("pass"))
         self.assertTrue(student.check_password("pass"))
 
-    def test_user_role_choices(self):
-        """Test that role choices are properly defined"""
-        self.assertEqual(User.Role.TEACHER, "teacher")
-        self.assertEqual(User.Role.STUDENT, "student")
-        # Check choices exist (order may vary)
-        choice_values = [choice[0] for choice in User.Role.choices]
-        choice_labels = [choice[1] for choice in User.Role.choices]
-        self.assertIn("teacher", choice_values)
-        self.assertIn("student", choice_values)
-        self.assertIn("Teacher", choice_labels)
-        self.assertIn("Student", choice_labels)
-
     def test_user_without_role(self):
         """Test creating user without specifying role"""
         user = User.objects.create_user(
@@ -82,34 +83,21 @@ class UserModelTest(TestCase):
 
         # Try to create another user with the same email
         with self.assertRaises(Exception):  # IntegrityError
-            User.objects.create_user(
-                username="user2",
-                email="test@example.com",
-                password="pass",
-                role=User.Role.STUDENT,
-            )
+            with transaction.atomic():
+                User.objects.create_user(
+                    username="user2",
+                    email="test@example.com",
+                    password="pass",
+                    role=User.Role.STUDENT,
+                )
 
 
 class ClassroomModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student1 = User.objects.create_user(
-            username="student1",
-            email="student1@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.student2 = User.objects.create_user(
-            username="student2",
-            email="student2@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = create_teacher()
+        cls.student1 = create_student("student1")
+        cls.student2 = create_student("student2")
 
     def test_create_classroom(self):
         """Test basic classroom creation and relationships"""
@@ -117,8 +105,8 @@ class ClassroomModelTest(TestCase):
         classroom.students.add(self.student1, self.student2)
 
         self.assertEqual(classroom.teacher, self.teacher)
-        self.assertIn(self.student1, classroom.students.all())
-        self.assertIn(self.student2, classroom.students.all())
+        self.assertTrue(classroom.students.filter(pk=self.student1.pk).exists())
+        self.assertTrue(classroom.students.filter(pk=self.student2.pk).exists())
         self.assertEqual(classroom.student_count(), 2)
 
     def test_classroom_str_method(self):
@@ -131,8 +119,9 @@ class ClassroomModelTest(TestCase):
         """Test student count method with various scenarios"""
         classroom = Classroom.objects.create(name="History", teacher=self.teacher)
 
-        # Empty classroom
-        self.assertEqual(classroom.student_count(), 0)
+        # Empty classroom, counted with a single COUNT query
+        with self.assertNumQueries(1):
+            self.assertEqual(classroom.student_count(), 0)
 
         # Add one student
         classroom.students.add(self.student1)
@@ -140,22 +129,14 @@ class ClassroomModelTest(TestCase):
 
         # Add second student
         classroom.students.add(self.student2)
-        self.assertEqual(classroom.student_count(), 2)
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(classroom.student_count(), 2)
+        self.assertIn("COUNT(", ctx.captured_queries[0]["sql"])
 
         # Remove a student
         classroom.students.remove(self.student1)
         self.assertEqual(classroom.student_count(), 1)
 
-    def test_invalid_teacher_role(self):
-        """Test validation when assigning non-teacher as teacher"""
-        student = User.objects.create_user(
-            username="student_fake_teacher", password="pass", role=User.Role.STUDENT
-        )
-        classroom = Classroom(name="Science", teacher=student)
-        with self.assertRaises(ValidationError) as context:
-            classroom.clean()
-        self.assertIn("teacher role", str(context.exception))
-
     def test_teacher_limit_choices(self):
         """Test that teacher field limits choices to teachers only"""
         classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
@@ -175,22 +156,13 @@ class ClassroomModelTest(TestCase):
         classroom.students.add(self.student1)
 
         # Test teacher's reverse relationship
-        self.assertIn(classroom, self.teacher.classrooms.all())
+        self.assertTrue(self.teacher.classrooms.filter(pk=classroom.pk).exists())
 
         # Test student's reverse relationship
-        self.assertIn(classroom, self.student1.classes.all())
+        self.assertTrue(self.student1.classes.filter(pk=classroom.pk).exists())
 
 
-class QuizModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-
+class QuizModelTest(ClassroomFixtureTestCase):
     def test_create_quiz(self):
         """Test basic quiz creation with default values"""
         quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
@@ -235,54 +207,26 @@ class QuizModelTest(TestCase):
         """Test question count method"""
         quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
 
-        # No questions initially
-        self.assertEqual(quiz.question_count(), 0)
+        # No questions initially, counted with a single COUNT query
+        with self.assertNumQueries(1):
+            self.assertEqual(quiz.question_count(), 0)
 
         # Add questions and test count
         Question.objects.create(quiz=quiz, text="Question 1")
         self.assertEqual(quiz.question_count(), 1)
 
         Question.objects.create(quiz=quiz, text="Question 2")
-        self.assertEqual(quiz.question_count(), 2)
-
-    def test_allowed_attempts_validation(self):
-        """Test validation for allowed_attempts field"""
-        quiz = Quiz(
-            title="Invalid Quiz",
-            classroom=self.classroom,
-            allowed_attempts=0,
-        )
-        with self.assertRaises(ValidationError) as context:
-            quiz.clean()
-        self.assertIn("at least 1", str(context.exception))
-
-    def test_negative_allowed_attempts_validation(self):
-        """Test validation for negative allowed_attempts"""
-        quiz = Quiz(
-            title="Invalid Quiz",
-            classroom=self.classroom,
-            allowed_attempts=-1,
-        )
-        with self.assertRaises(ValidationError):
-            quiz.clean()
+        with self.assertNumQueries(1) as ctx:
+            self.assertEqual(quiz.question_count(), 2)
+        self.assertIn("COUNT(", ctx.captured_queries[0]["sql"])
 
     def test_quiz_classroom_relationship(self):
         """Test quiz-classroom relationship"""
         quiz = Quiz.objects.create(title="Test Quiz", classroom=self.classroom)
-        self.assertIn(quiz, self.classroom.quizzes.all())
+        self.assertTrue(self.classroom.quizzes.filter(pk=quiz.pk).exists())
 
 
-class QuestionModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-
+class QuestionModelTest(QuizFixtureTestCase):
     def test_create_question_with_auto_order(self):
         """Test question creation with automatic ordering"""
         q1 = Question.objects.create(quiz=self.quiz, text="Question 1")
@@ -301,6 +245,25 @@ class QuestionModelTest(TestCase):
         self.assertEqual(q1.order, 5)
         self.assertEqual(q2.order, 6)
 
+    def test_update_question_keeps_order(self):
+        """Test saving an existing question does not reassign its order"""
+        q1 = Question.objects.create(quiz=self.quiz, text="Question 1")
+        Question.objects.create(quiz=self.quiz, text="Question 2")
+
+        q1.text = "Updated question"
+        with self.assertNumQueries(1):
+            q1.save()
+
+        q1.refresh_from_db()
+        self.assertEqual(q1.order, 1)
+
+    def test_create_question_by_quiz_id_does_not_fetch_quiz(self):
+        """Test auto ordering uses quiz_id without loading the quiz"""
+        with self.assertNumQueries(2):
+            question = Question.objects.create(quiz_id=self.quiz.id, text="Q")
+
+        self.assertEqual(question.order, 1)
+
     def test_question_str_method(self):
         """Test question string representation"""
         question = Question.objects.create(
@@ -342,26 +305,33 @@ class QuestionModelTest(TestCase):
         question = Question.objects.create(quiz=self.quiz, text="Test question")
 
         # Create answers
-        a1 = Answer.objects.create(question=question, text="Correct 1", is_correct=True)
-        a2 = Answer.objects.create(question=question, text="Wrong 1", is_correct=False)
-        a3 = Answer.objects.create(question=question, text="Correct 2", is_correct=True)
-        a4 = Answer.objects.create(question=question, text="Wrong 2", is_correct=False)
-
-        correct_answers = question.get_correct_answers()
+        a1, a2, a3, a4 = Answer.objects.bulk_create(
+            [
+                Answer(question=question, text="Correct 1", is_correct=True),
+                Answer(question=question, text="Wrong 1", is_correct=False),
+                Answer(question=question, text="Correct 2", is_correct=True),
+                Answer(question=question, text="Wrong 2", is_correct=False),
+            ]
+        )
+
+        with self.assertNumQueries(1):
+            correct_ids = set(
+                question.get_correct_answers().values_list("id", flat=True)
+            )
 
-        self.assertEqual(correct_answers.count(), 2)
-        self.assertIn(a1, correct_answers)
-        self.assertIn(a3, correct_answers)
-        self.assertNotIn(a2, correct_answers)
-        self.assertNotIn(a4, correct_answers)
+        self.assertEqual(correct_ids, {a1.id, a3.id})
 
     def test_get_correct_answers_empty(self):
         """Test getting correct answers when none exist"""
         question = Question.objects.create(quiz=self.quiz, text="Test question")
 
         # Create only wrong answers
-        Answer.objects.create(question=question, text="Wrong 1", is_correct=False)
-        Answer.objects.create(question=question, text="Wrong 2", is_correct=False)
+        Answer.objects.bulk_create(
+            [
+                Answer(question=question, text="Wrong 1", is_correct=False),
+                Answer(question=question, text="Wrong 2", is_correct=False),
+            ]
+        )
 
         correct_answers = question.get_correct_answers()
         self.assertEqual(correct_answers.count(), 0)
@@ -369,7 +339,7 @@ class QuestionModelTest(TestCase):
     def test_question_quiz_relationship(self):
         """Test question-quiz relationship"""
         question = Question.objects.create(quiz=self.quiz, text="Test question")
-        self.assertIn(question, self.quiz.questions.all())
+        self.assertTrue(self.quiz.questions.filter(pk=question.pk).exists())
 
     def test_order_assignment_across_multiple_quizzes(self):
         """Test that order assignment is independent for different quizzes"""
@@ -390,17 +360,11 @@ class QuestionModelTest(TestCase):
         self.assertEqual(q2_quiz2.order, 2)
 
 
-class AnswerModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(quiz=self.quiz, text="Test Question")
+class AnswerModelTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.question = create_question(cls.quiz)
 
     def test_create_answer_default_values(self):
         """Test answer creation with default values"""
@@ -435,6 +399,51 @@ class AnswerModelTest(TestCase):
         )
         self.assertEqual(answer.text, "Answer with spaces")
 
+    def test_text_normalized_on_save(self):
+        """Test a lowercased copy of the text is kept in sync on save"""
+        answer = Answer.objects.create(question=self.question, text="  Paris  ")
+        self.assertEqual(answer.text_normalized, "paris")
+
+        answer.text = "London"
+        answer.save(update_fields=["text"])
+
+        answer.refresh_from_db()
+        self.assertEqual(answer.text_normalized, "london")
+
+    def test_text_normalized_on_bulk_create(self):
+        """Test bulk_create fills the lowercased copy that save() would set"""
+        Answer.objects.bulk_create(
+            [Answer(question=self.question, text="Paris", is_correct=True)]
+        )
+
+        self.assertEqual(
+            list(self.question.answers.values_list("text_normalized", flat=True)),
+            ["paris"],
+        )
+
+    def test_text_normalized_on_queryset_updates(self):
+        """Test update() and bulk_update() keep the lowercased copy in sync"""
+        answer = Answer.objects.create(question=self.question, text="Paris")
+
+        Answer.objects.filter(pk=answer.pk).update(text="London")
+        answer.refresh_from_db()
+        self.assertEqual(answer.text_normalized, "london")
+
+        answer.text = "Rome"
+        Answer.objects.bulk_update([answer], ["text"])
+        answer.refresh_from_db()
+        self.assertEqual(answer.text_normalized, "rome")
+
+    def test_bulk_create_rejects_untrimmed_text(self):
+        """Test the database rejects padded text that bypassed save()"""
+        for text in [" Padded answer ", "\tTabbed answer", "Answer\n"]:
+            with self.subTest(text=text):
+                with self.assertRaises(IntegrityError):
+                    with transaction.atomic():
+                        Answer.objects.bulk_create(
+                            [Answer(question=self.question, text=text)]
+                        )
+
     def test_empty_text_handling(self):
         """Test handling of empty text"""
         answer = Answer.objects.create(question=self.question, text="")
@@ -445,14 +454,16 @@ class AnswerModelTest(TestCase):
         answer = Answer(question=self.question, text=None)
         # Should raise IntegrityError due to NOT NULL constraint
         with self.assertRaises(IntegrityError):
-            answer.save()
+            with transaction.atomic():
+                answer.save()
 
     def test_unique_answer_per_question_constraint(self):
         """Test unique constraint for answer text per question"""
         Answer.objects.create(question=self.question, text="Duplicate answer")
 
         with self.assertRaises(IntegrityError):
-            Answer.objects.create(question=self.question, text="Duplicate answer")
+            with transaction.atomic():
+                Answer.objects.create(question=self.question, text="Duplicate answer")
 
     def test_same_answer_text_different_questions(self):
         """Test same answer text is allowed for different questions"""
@@ -474,41 +485,38 @@ class AnswerModelTest(TestCase):
     def test_answer_question_relationship(self):
         """Test answer-question relationship"""
         answer = Answer.objects.create(question=self.question, text="Test")
-        self.assertIn(answer, self.question.answers.all())
+        self.assertTrue(self.question.answers.filter(pk=answer.pk).exists())
 
     def test_multiple_correct_answers(self):
         """Test that multiple answers can be correct for one question"""
-        answer1 = Answer.objects.create(
-            question=self.question, text="Correct 1", is_correct=True
-        )
-        answer2 = Answer.objects.create(
-            question=self.question, text="Correct 2", is_correct=True
+        answer1, answer2 = Answer.objects.bulk_create(
+            [
+                Answer(question=self.question, text="Correct 1", is_correct=True),
+                Answer(question=self.question, text="Correct 2", is_correct=True),
+            ]
         )
 
-        correct_answers = self.question.get_correct_answers()
-        self.assertEqual(correct_answers.count(), 2)
-        self.assertIn(answer1, correct_answers)
-        self.assertIn(answer2, correct_answers)
+        correct_ids = set(
+            self.question.get_correct_answers().values_list("id", flat=True)
+        )
+        self.assertEqual(correct_ids, {answer1.id, answer2.id})
 
 
-class StudentQuizAttemptModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
+class StudentQuizAttemptModelTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        # Shared submission time for question attempts; these tests only care
+        # whether an attempt was submitted, not when.
+        cls.submitted_at = timezone.now()
+        # Order is set explicitly so bulk_create can skip Question.save().
+        cls.question1, cls.question2 = Question.objects.bulk_create(
+            [
+                Question(quiz=cls.quiz, text="Question 1", order=1),
+                Question(quiz=cls.quiz, text="Question 2", order=2),
+            ]
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question1 = Question.objects.create(quiz=self.quiz, text="Question 1")
-        self.question2 = Question.objects.create(quiz=self.quiz, text="Question 2")
 
     def test_create_quiz_attempt(self):
         """Test basic quiz attempt creation"""
@@ -547,10 +555,10 @@ class StudentQuizAttemptModelTest(TestCase):
 
         # Create a completed question attempt for first question
         question_attempt = StudentQuestionAttempt.objects.create(
-            quiz_attempt=attempt, question=self.question1
+            quiz_attempt=attempt,
+            question=self.question1,
+            submitted_at=self.submitted_at,
         )
-        question_attempt.submitted_at = timezone.now()
-        question_attempt.save()
 
         # Next question should be question2
         next_question = attempt.get_next_question()
@@ -563,17 +571,32 @@ class StudentQuizAttemptModelTest(TestCase):
         )
 
         # Complete both questions
-        for question in [self.question1, self.question2]:
-            question_attempt = StudentQuestionAttempt.objects.create(
-                quiz_attempt=attempt, question=question
+        StudentQuestionAttempt.objects.bulk_create(
+            StudentQuestionAttempt(
+                quiz_attempt=attempt, question=question, submitted_at=self.submitted_at
             )
-            question_attempt.submitted_at = timezone.now()
-            question_attempt.save()
+            for question in [self.question1, self.question2]
+        )
 
         # Should return None when all questions are completed
         next_question = attempt.get_next_question()
         self.assertIsNone(next_question)
 
+    def test_get_next_question_skips_only_submitted_attempts(self):
+        """Test an unsubmitted question attempt keeps its question pending"""
+        attempt = StudentQuizAttempt.objects.create(
+            student=self.student, quiz=self.quiz
+        )
+        StudentQuestionAttempt.objects.create(
+            quiz_attempt=attempt, question=self.question1
+        )
+
+        attempt = StudentQuizAttempt.objects.get(pk=attempt.pk)
+        with self.assertNumQueries(1):
+            next_question = attempt.get_next_question()
+
+        self.assertEqual(next_question, self.question1)
+
     # NOTE: calculate_score method is commented out in the model
     # def test_calculate_score_empty_attempt(self):
     #     """Test calculating score for attempt with no answers"""
@@ -643,21 +666,13 @@ class StudentQuizAttemptModelTest(TestCase):
 
     #     self.assertEqual(attempt.score, Decimal("50.00"))
 
-    def test_invalid_student_role_validation(self):
-        """Test validation when non-student attempts quiz"""
-        teacher_attempt = StudentQuizAttempt(student=self.teacher, quiz=self.quiz)
-
-        with self.assertRaises(ValidationError) as context:
-            teacher_attempt.clean()
-        self.assertIn("student role", str(context.exception))
-
     def test_student_quiz_relationship(self):
         """Test relationship with student and quiz"""
         attempt = StudentQuizAttempt.objects.create(
             student=self.student, quiz=self.quiz
         )
 
-        self.assertIn(attempt, self.student.quiz_attempts.all())
+        self.assertTrue(self.student.quiz_attempts.filter(pk=attempt.pk).exists())
 
     def test_multiple_attempts_same_quiz(self):
         """Test that same student can have multiple attempts for same quiz"""
@@ -673,25 +688,14 @@ class StudentQuizAttemptModelTest(TestCase):
         self.assertEqual(attempt1.quiz, attempt2.quiz)
 
 
-class StudentQuestionAttemptModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(quiz=self.quiz, text="Question 1")
-        self.quiz_attempt = StudentQuizAttempt.objects.create(
-            student=self.student, quiz=self.quiz
+class StudentQuestionAttemptModelTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        cls.question = create_question(cls.quiz, "Question 1")
+        cls.quiz_attempt = StudentQuizAttempt.objects.create(
+            student=cls.student, quiz=cls.quiz
         )
 
     def test_create_question_attempt(self):
@@ -715,14 +719,13 @@ class StudentQuestionAttemptModelTest(TestCase):
 
     def test_submitted_question_attempt(self):
         """Test question attempt with submission time"""
+        submit_time = timezone.now()
         attempt = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.quiz_attempt, question=self.question
+            quiz_attempt=self.quiz_attempt,
+            question=self.question,
+            submitted_at=submit_time,
         )
 
-        submit_time = timezone.now()
-        attempt.submitted_at = submit_time
-        attempt.save()
-
         self.assertEqual(attempt.submitted_at, submit_time)
 
     def test_unique_question_attempt_constraint(self):
@@ -732,18 +735,14 @@ class StudentQuestionAttemptModelTest(TestCase):
         )
 
         with self.assertRaises(IntegrityError):
-            StudentQuestionAttempt.objects.create(
-                quiz_attempt=self.quiz_attempt, question=self.question
-            )
+            with transaction.atomic():
+                StudentQuestionAttempt.objects.create(
+                    quiz_attempt=self.quiz_attempt, question=self.question
+                )
 
     def test_same_question_different_attempts(self):
         """Test same question can be attempted by different quiz attempts"""
-        student2 = User.objects.create_user(
-            username="student2",
-            email="student2@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
+        student2 = create_student("student2")
         quiz_attempt2 = StudentQuizAttempt.objects.create(
             student=student2, quiz=self.quiz
         )
@@ -790,7 +789,9 @@ class StudentQuestionAttemptModelTest(TestCase):
             quiz_attempt=self.quiz_attempt, question=self.question
         )
 
-        self.assertIn(attempt, self.quiz_attempt.question_attempts.all())
+        self.assertTrue(
+            self.quiz_attempt.question_attempts.filter(pk=attempt.pk).exists()
+        )
 
     def test_multiple_questions_same_attempt(self):
         """Test multiple questions can be attempted in same quiz attempt"""
@@ -803,41 +804,32 @@ class StudentQuestionAttemptModelTest(TestCase):
             quiz_attempt=self.quiz_attempt, question=question2
         )
 
-        self.assertEqual(self.quiz_attempt.question_attempts.count(), 2)
-        self.assertIn(attempt1, self.quiz_attempt.question_attempts.all())
-        self.assertIn(attempt2, self.quiz_attempt.question_attempts.all())
+        with self.assertNumQueries(1):
+            self.assertQuerySetEqual(
+                self.quiz_attempt.question_attempts.all(),
+                [attempt1.pk, attempt2.pk],
+                transform=attrgetter("pk"),
+                ordered=False,
+            )
 
 
-class StudentAnswerModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(
-            quiz=self.quiz, text="What is 2+2?", time_limit=60
-        )
-        self.quiz_attempt = StudentQuizAttempt.objects.create(
-            student=self.student, quiz=self.quiz
+class StudentAnswerModelTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        cls.question = create_question(cls.quiz, "What is 2+2?", time_limit=60)
+        cls.quiz_attempt = StudentQuizAttempt.objects.create(
+            student=cls.student, quiz=cls.quiz
         )
-        self.question_attempt = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.quiz_attempt, question=self.question
+        cls.question_attempt = StudentQuestionAttempt.objects.create(
+            quiz_attempt=cls.quiz_attempt, question=cls.question
         )
 
     def test_create_student_answer(self):
         """Test basic student answer creation"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         answer = StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="4"
@@ -847,10 +839,37 @@ class StudentAnswerModelTest(TestCase):
         self.assertEqual(answer.text, "4")
         self.assertFalse(answer.is_correct)  # will be calculated
 
+    def test_correctness_ignores_case(self):
+        """Test answers are matched case-insensitively on save"""
+        Answer.objects.create(question=self.question, text="Four", is_correct=True)
+        self.question_attempt.submitted_at = timezone.now()
+        self.question_attempt.save(update_fields=["submitted_at"])
+
+        answer = StudentAnswer.objects.create(
+            question_attempt=self.question_attempt, text="FOUR"
+        )
+
+        self.assertTrue(answer.is_correct)
+
+    def test_calculate_correctness_with_precomputed_texts(self):
+        """Test correctness check against a precomputed set of correct texts"""
+        Answer.objects.create(question=self.question, text="Four", is_correct=True)
+        Answer.objects.create(question=self.question, text="Five", is_correct=False)
+        self.question_attempt.submitted_at = timezone.now()
+        self.question_attempt.save(update_fields=["submitted_at"])
+
+        correct_texts = {"four"}
+
+        right = StudentAnswer(question_attempt=self.question_attempt, text=" four ")
+        wrong = StudentAnswer(question_attempt=self.question_attempt, text="five")
+        with self.assertNumQueries(0):
+            self.assertTrue(right._calculate_correctness(correct_texts))
+            self.assertFalse(wrong._calculate_correctness(correct_texts))
+
     def test_student_answer_str_method(self):
         """Test student answer string representation"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         # Add a correct answer to the question so the student answer will be correct
         Answer.objects.create(
@@ -861,15 +880,21 @@ class StudentAnswerModelTest(TestCase):
             question_attempt=self.question_attempt, text="Test answer", is_correct=True
         )
 
+        # Load the relations __str__ walks in one joined query.
+        answer = StudentAnswer.objects.select_related(
+            "question_attempt__quiz_attempt__student", "question_attempt__question"
+        ).get(pk=answer.pk)
+
         expected_str = (
             f"{answer.id}. {self.student} - What is 2+2?: Test answer (Correct)"
         )
-        self.assertEqual(str(answer), expected_str)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(answer), expected_str)
 
     def test_student_answer_str_method_incorrect(self):
         """Test student answer string representation for incorrect answer"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         answer = StudentAnswer.objects.create(
             question_attempt=self.question_attempt,
@@ -877,15 +902,21 @@ class StudentAnswerModelTest(TestCase):
             is_correct=False,
         )
 
+        # Load the relations __str__ walks in one joined query.
+        answer = StudentAnswer.objects.select_related(
+            "question_attempt__quiz_attempt__student", "question_attempt__question"
+        ).get(pk=answer.pk)
+
         expected_str = (
             f"{answer.id}. {self.student} - What is 2+2?: Wrong answer (Incorrect)"
         )
-        self.assertEqual(str(answer), expected_str)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(answer), expected_str)
 
     def test_text_stripping_on_save(self):
         """Test that answer text is stripped on save"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         answer = StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="  4  "
@@ -893,56 +924,44 @@ class StudentAnswerModelTest(TestCase):
 
         self.assertEqual(answer.text, "4")
 
-    def test_correctness_calculation_correct_answer(self):
-        """Test correctness calculation for correct answer"""
-        # Add correct answer to question
-        Answer.objects.create(question=self.question, text="4", is_correct=True)
-
-        self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
-
-        answer = StudentAnswer.objects.create(
-            question_attempt=self.question_attempt, text="4"
-        )
-
-        self.assertTrue(answer.is_correct)
-
-    def test_correctness_calculation_incorrect_answer(self):
-        """Test correctness calculation for incorrect answer"""
-        # Add correct answer to question
-        Answer.objects.create(question=self.question, text="4", is_correct=True)
-
-        self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
-
-        answer = StudentAnswer.objects.create(
-            question_attempt=self.question_attempt, text="5"
-        )
-
-        self.assertFalse(answer.is_correct)
-
-    def test_correctness_case_insensitive(self):
-        """Test that correctness check is case insensitive"""
-        Answer.objects.create(question=self.question, text="Paris", is_correct=True)
+    def test_correctness_calculation(self):
+        """Test correctness calculation against the question's correct answers"""
+        for text, is_correct in [
+            ("4", True),
+            ("four", True),
+            ("Paris", True),
+            ("5", False),
+        ]:
+            Answer.objects.create(
+                question=self.question, text=text, is_correct=is_correct
+            )
 
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
-
-        answer = StudentAnswer.objects.create(
-            question_attempt=self.question_attempt, text="paris"
-        )
-
-        self.assertTrue(answer.is_correct)
+        self.question_attempt.save(update_fields=["submitted_at"])
+
+        cases = [
+            ("correct", "4", True),
+            ("incorrect", "5", False),
+            ("case insensitive", "paris", True),
+            ("one of several correct", "four", True),
+        ]
+        for case, text, expected in cases:
+            with self.subTest(case=case), transaction.atomic():
+                answer = StudentAnswer.objects.create(
+                    question_attempt=self.question_attempt, text=text
+                )
+                self.assertEqual(answer.is_correct, expected)
+                transaction.set_rollback(True)
 
     def test_time_limit_exceeded(self):
         """Test answer is marked incorrect when time limit exceeded"""
         Answer.objects.create(question=self.question, text="4", is_correct=True)
 
         # Set submitted_at to exceed time limit (60 seconds + buffer)
-        start_time = timezone.now() - timedelta(seconds=65)
-        self.question_attempt.started_at = start_time
-        self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        now = timezone.now()
+        self.question_attempt.started_at = now - timedelta(seconds=65)
+        self.question_attempt.submitted_at = now
+        self.question_attempt.save(update_fields=["started_at", "submitted_at"])
 
         answer = StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="4"
@@ -955,10 +974,10 @@ class StudentAnswerModelTest(TestCase):
         Answer.objects.create(question=self.question, text="4", is_correct=True)
 
         # Set submitted_at within time limit
-        start_time = timezone.now() - timedelta(seconds=30)
-        self.question_attempt.started_at = start_time
-        self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        now = timezone.now()
+        self.question_attempt.started_at = now - timedelta(seconds=30)
+        self.question_attempt.submitted_at = now
+        self.question_attempt.save(update_fields=["started_at", "submitted_at"])
 
         answer = StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="4"
@@ -972,10 +991,10 @@ class StudentAnswerModelTest(TestCase):
             quiz=self.quiz, text="No time limit", time_limit=None
         )
         question_attempt_no_limit = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.quiz_attempt, question=question_no_limit
+            quiz_attempt=self.quiz_attempt,
+            question=question_no_limit,
+            submitted_at=timezone.now(),
         )
-        question_attempt_no_limit.submitted_at = timezone.now()
-        question_attempt_no_limit.save()
 
         Answer.objects.create(
             question=question_no_limit, text="Answer", is_correct=True
@@ -990,21 +1009,22 @@ class StudentAnswerModelTest(TestCase):
     def test_unique_student_answer_constraint(self):
         """Test unique constraint for student answer per question attempt"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="First answer"
         )
 
         with self.assertRaises(IntegrityError):
-            StudentAnswer.objects.create(
-                question_attempt=self.question_attempt, text="First answer"
-            )
+            with transaction.atomic():
+                StudentAnswer.objects.create(
+                    question_attempt=self.question_attempt, text="First answer"
+                )
 
     def test_different_answers_same_question_attempt(self):
         """Test different answers can be created for same question attempt (different text)"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         answer1 = StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="Answer 1"
@@ -1031,7 +1051,7 @@ class StudentAnswerModelTest(TestCase):
     def test_clean_method_question_attempt_submitted(self):
         """Test clean method passes when question attempt is submitted"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         answer = StudentAnswer(
             question_attempt=self.question_attempt, text="Test answer"
@@ -1043,41 +1063,25 @@ class StudentAnswerModelTest(TestCase):
         except ValidationError:
             self.fail("clean() raised ValidationError unexpectedly")
 
-    def test_multiple_correct_answers_matching(self):
-        """Test when multiple correct answers exist and student provides one"""
-        Answer.objects.create(question=self.question, text="4", is_correct=True)
-        Answer.objects.create(question=self.question, text="four", is_correct=True)
-
-        self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
-
-        answer = StudentAnswer.objects.create(
-            question_attempt=self.question_attempt, text="four"
-        )
-
-        self.assertTrue(answer.is_correct)
-
     def test_student_answer_relationship(self):
         """Test student answer relationship with question attempt"""
         self.question_attempt.submitted_at = timezone.now()
-        self.question_attempt.save()
+        self.question_attempt.save(update_fields=["submitted_at"])
 
         answer = StudentAnswer.objects.create(
             question_attempt=self.question_attempt, text="Test"
         )
 
-        self.assertIn(answer, self.question_attempt.student_answers.all())
+        self.assertTrue(
+            self.question_attempt.student_answers.filter(pk=answer.pk).exists()
+        )
 
 
-class EnrollmentCodeModelTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
+class EnrollmentCodeModelTest(ClassroomFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_classroom = create_classroom(cls.teacher, "Science")
 
     def test_create_enrollment_code(self):
         """Test basic enrollment code creation"""
@@ -1112,10 +1116,11 @@ class EnrollmentCodeModelTest(TestCase):
         """Test unique constraint for enrollment codes"""
         EnrollmentCode.objects.create(code="DUPLICATE", classroom=self.classroom)
 
-        classroom2 = Classroom.objects.create(name="Science", teacher=self.teacher)
-
         with self.assertRaises(IntegrityError):
-            EnrollmentCode.objects.create(code="DUPLICATE", classroom=classroom2)
+            with transaction.atomic():
+                EnrollmentCode.objects.create(
+                    code="DUPLICATE", classroom=self.other_classroom
+                )
 
     def test_generate_code_method(self):
         """Test static generate_code method"""
@@ -1125,22 +1130,23 @@ class EnrollmentCodeModelTest(TestCase):
         self.assertEqual(len(code), 8)
 
         # Should contain only uppercase letters and digits
-        self.assertTrue(all(c.isupper() or c.isdigit() for c in code))
+        self.assertLessEqual(set(code), ENROLLMENT_CODE_CHARS)
 
     def test_generate_code_custom_length(self):
         """Test generate_code with custom length"""
         code = EnrollmentCode.generate_code(length=12)
 
         self.assertEqual(len(code), 12)
-        self.assertTrue(all(c.isupper() or c.isdigit() for c in code))
+        self.assertLessEqual(set(code), ENROLLMENT_CODE_CHARS)
 
     def test_generate_code_uniqueness(self):
         """Test that generate_code produces different codes (probabilistically)"""
-        codes = [EnrollmentCode.generate_code() for _ in range(10)]
-        unique_codes = set(codes)
-
         # With 8 character codes, we should get all unique codes in 10 attempts
-        self.assertEqual(len(unique_codes), 10)
+        codes = set()
+        for _ in range(10):
+            code = EnrollmentCode.generate_code()
+            self.assertNotIn(code, codes)
+            codes.add(code)
 
     def test_generate_for_class_new_code(self):
         """Test generate_for_class method for new classroom"""
@@ -1173,45 +1179,27 @@ class EnrollmentCodeModelTest(TestCase):
             code="EXIST123", classroom=self.classroom
         )
 
-        # Mock the generate_code method to return existing code first, then unique
-        original_generate = EnrollmentCode.generate_code
-        call_count = 0
-
-        def mock_generate(length=8):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return "EXIST123"  # Collision on first call
-            return original_generate(length)
+        # Return the existing code first to force a collision, then a free one
+        with patch.object(
+            EnrollmentCode, "generate_code", side_effect=["EXIST123", "ABCD1234"]
+        ) as generate_code:
+            new_code = EnrollmentCode.generate_for_class(self.other_classroom)
 
-        # Temporarily replace the method
-        EnrollmentCode.generate_code = staticmethod(mock_generate)
-
-        try:
-            classroom2 = Classroom.objects.create(name="Science", teacher=self.teacher)
-            new_code = EnrollmentCode.generate_for_class(classroom2)
-
-            # Should have generated a different code due to collision
-            self.assertNotEqual(new_code.code, "EXIST123")
-            self.assertEqual(new_code.classroom, classroom2)
-            self.assertTrue(
-                call_count > 1
-            )  # Should have called generate multiple times
-
-        finally:
-            # Restore original method
-            EnrollmentCode.generate_code = staticmethod(original_generate)
+        # Should have generated a different code due to collision
+        self.assertEqual(new_code.code, "ABCD1234")
+        self.assertEqual(new_code.classroom, self.other_classroom)
+        self.assertEqual(generate_code.call_count, 2)
 
     def test_classroom_enrollment_codes_relationship(self):
         """Test reverse relationship from classroom to enrollment codes"""
         code1 = EnrollmentCode.objects.create(code="CODE1", classroom=self.classroom)
         code2 = EnrollmentCode.objects.create(code="CODE2", classroom=self.classroom)
 
-        classroom_codes = self.classroom.enrollment_codes.all()
+        classroom_code_ids = set(
+            self.classroom.enrollment_codes.values_list("pk", flat=True)
+        )
 
-        self.assertIn(code1, classroom_codes)
-        self.assertIn(code2, classroom_codes)
-        self.assertEqual(classroom_codes.count(), 2)
+        self.assertEqual(classroom_code_ids, {code1.pk, code2.pk})
 
     def test_enrollment_code_cascade_delete(self):
         """Test enrollment code is deleted when classroom is deleted"""
@@ -1236,3 +1224,49 @@ class EnrollmentCodeModelTest(TestCase):
         # Should return the same object on subsequent calls (update_or_create)
         enrollment_code2 = EnrollmentCode.generate_for_class(self.classroom)
         self.assertEqual(enrollment_code.id, enrollment_code2.id)
+
+
+class ModelValidationTest(SimpleTestCase):
+    """Checks that only need in-memory instances, no database."""
+
+    def test_user_role_choices(self):
+        """Test that role choices are properly defined"""
+        self.assertEqual(User.Role.TEACHER, "teacher")
+        self.assertEqual(User.Role.STUDENT, "student")
+        # Check choices exist (order may vary)
+        choice_values = [choice[0] for choice in User.Role.choices]
+        choice_labels = [choice[1] for choice in User.Role.choices]
+        self.assertIn("teacher", choice_values)
+        self.assertIn("student", choice_values)
+        self.assertIn("Teacher", choice_labels)
+        self.assertIn("Student", choice_labels)
+
+    def test_invalid_teacher_role(self):
+        """Test validation when assigning non-teacher as teacher"""
+        student = User(username="student_fake_teacher", role=User.Role.STUDENT)
+        classroom = Classroom(name="Science", teacher=student)
+        with self.assertRaises(ValidationError) as context:
+            classroom.clean()
+        self.assertIn("teacher role", str(context.exception))
+
+    def test_invalid_student_role_validation(self):
+        """Test validation when non-student attempts quiz"""
+        teacher = User(username="teacher", role=User.Role.TEACHER)
+        teacher_attempt = StudentQuizAttempt(student=teacher, quiz=Quiz())
+
+        with self.assertRaises(ValidationError) as context:
+            teacher_attempt.clean()
+        self.assertIn("student role", str(context.exception))
+
+    def test_allowed_attempts_validation(self):
+        """Test validation for allowed_attempts field"""
+        quiz = Quiz(title="Invalid Quiz", allowed_attempts=0)
+        with self.assertRaises(ValidationError) as context:
+            quiz.clean()
+        self.assertIn("at least 1", str(context.exception))
+
+    def test_negative_allowed_attempts_validation(self):
+        """Test validation for negative allowed_attempts"""
+        quiz = Quiz(title="Invalid Quiz", allowed_attempts=-1)
+        with self.assertRaises(ValidationError):
+            quiz.clean()
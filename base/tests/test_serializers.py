@@ -1,11 +1,16 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.utils import timezone
 from decimal import Decimal
 from rest_framework.test import APITestCase, APIClient
-from rest_framework import status
-from unittest.mock import patch, Mock
+from rest_framework import serializers, status
+from unittest.mock import patch, Mock, PropertyMock
+from types import SimpleNamespace
 from django.urls import reverse
-import requests
+from django.contrib.auth.tokens import default_token_generator
+from djoser.signals import user_activated
+from djoser.utils import encode_uid
 from ..models import (
     User,
     Classroom,
@@ -23,8 +28,12 @@ from ..serializers import (
     ClassroomSerializer,
     ClassroomDeleteStudentsSerializer,
     AnswerSerializer,
+    AnswerUpdateSerializer,
+    DUPLICATE_ANSWER_MESSAGE,
     QuestionSerializer,
+    QuestionUpdateSerializer,
     QuizSerializer,
+    QuizUpdateSerializer,
     StudentAnswerSerializer,
     StudentAnswersSubmitSerializer,
     StudentQuestionAttemptSerializer,
@@ -37,6 +46,14 @@ from ..serializers import (
     TeacherStudentQuestionAttemptStatsSerializer,
 )
 from ..permissions import IsTeacher, IsStudent
+from .factories import (
+    create_teacher,
+    create_student,
+    create_quiz,
+    create_question,
+    ClassroomFixtureTestCase,
+    QuizFixtureTestCase,
+)
 
 
 class CustomUserCreateSerializerTest(TestCase):
@@ -97,8 +114,9 @@ class CustomUserCreateSerializerTest(TestCase):
 
 
 class BaseUserSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
             first_name="Test",
@@ -127,33 +145,31 @@ class BaseUserSerializerTest(TestCase):
         self.assertTrue(readonly_fields["username"]["read_only"])
 
 
-class ClassroomSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student1 = User.objects.create_user(
-            username="student1",
-            email="student1@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.student2 = User.objects.create_user(
-            username="student2",
-            email="student2@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
+class ClassroomSerializerTest(ClassroomFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student1 = create_student("student1")
+        cls.student2 = create_student("student2")
+        cls.classroom.students.add(cls.student1, cls.student2)
+
+    def test_students_match_base_user_serializer(self):
+        """Test students render exactly as BaseUserSerializer would"""
+        request_mock = SimpleNamespace(user=self.teacher)
+        classroom = ClassroomSerializer.setup_queryset(
+            Classroom.objects.all(), self.teacher
+        ).get()
+
+        data = ClassroomSerializer(classroom, context={"request": request_mock}).data
+
+        self.assertEqual(
+            data["students"],
+            BaseUserSerializer(classroom.students.all(), many=True).data,
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.classroom.students.add(self.student1, self.student2)
 
     def test_serializer_fields(self):
         """Test classroom serializer includes correct fields"""
-        request_mock = Mock()
-        request_mock.user = self.teacher
+        request_mock = SimpleNamespace(user=self.teacher)
 
         serializer = ClassroomSerializer(
             self.classroom, context={"request": request_mock}
@@ -165,10 +181,57 @@ class ClassroomSerializerTest(TestCase):
         self.assertEqual(len(data["students"]), 2)
         self.assertEqual(data["student_count"], 2)
 
+    def test_setup_queryset_loads_teacher_and_students(self):
+        """Test setup_queryset joins the teacher and prefetches students"""
+        request_mock = SimpleNamespace(user=self.teacher)
+
+        classroom = ClassroomSerializer.setup_queryset(Classroom.objects.all()).get()
+        with self.assertNumQueries(0):
+            data = ClassroomSerializer(
+                classroom, context={"request": request_mock}
+            ).data
+
+        self.assertEqual(data["teacher"]["username"], "teacher")
+        self.assertEqual(len(data["students"]), 2)
+
+    def test_setup_queryset_loads_only_rendered_user_columns(self):
+        """Test teacher and students are loaded without unused user columns"""
+        with CaptureQueriesContext(connection) as queries:
+            classroom = ClassroomSerializer.setup_queryset(
+                Classroom.objects.all()
+            ).get()
+            list(classroom.students.all())
+
+        self.assertEqual(len(queries), 2)
+        for query in queries:
+            self.assertNotIn("password", query["sql"])
+        self.assertEqual(
+            classroom.teacher.get_deferred_fields(),
+            classroom.students.all()[0].get_deferred_fields(),
+        )
+
+    def test_setup_queryset_narrows_students_for_student_user(self):
+        """Test students' prefetch only loads the requesting student"""
+        request_mock = SimpleNamespace(user=self.student1)
+
+        classroom = ClassroomSerializer.setup_queryset(
+            Classroom.objects.all(), self.student1
+        ).get()
+        self.assertEqual(classroom.visible_students, [self.student1])
+
+        with self.assertNumQueries(0):
+            data = ClassroomSerializer(
+                classroom, context={"request": request_mock}
+            ).data
+
+        self.assertEqual(
+            [student["id"] for student in data["students"]], [self.student1.id]
+        )
+        self.assertEqual(data["student_count"], 2)
+
     def test_student_view_filters_students(self):
         """Test that students only see themselves in the students list"""
-        request_mock = Mock()
-        request_mock.user = self.student1
+        request_mock = SimpleNamespace(user=self.student1)
 
         serializer = ClassroomSerializer(
             self.classroom, context={"request": request_mock}
@@ -179,7 +242,7 @@ class ClassroomSerializerTest(TestCase):
         self.assertEqual(data["students"][0]["id"], self.student1.id)
 
 
-class ClassroomDeleteStudentsSerializerTest(TestCase):
+class ClassroomDeleteStudentsSerializerTest(SimpleTestCase):
     def test_valid_data(self):
         """Test valid student deletion data"""
         data = {"student_ids": [1, 2, 3]}
@@ -199,23 +262,12 @@ class ClassroomDeleteStudentsSerializerTest(TestCase):
         self.assertFalse(serializer.is_valid())
 
 
-class AnswerSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(quiz=self.quiz, text="Test Question")
+class AnswerSerializerTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        cls.question = Question.objects.create(quiz=cls.quiz, text="Test Question")
 
     def test_valid_answer_creation(self):
         """Test creating valid answer"""
@@ -238,9 +290,72 @@ class AnswerSerializerTest(TestCase):
         }
         serializer = AnswerSerializer(data=data)
         self.assertFalse(serializer.is_valid())
-        self.assertTrue(
-            "text" in serializer.errors or "non_field_errors" in serializer.errors
+        self.assertEqual(serializer.errors["text"], [DUPLICATE_ANSWER_MESSAGE])
+
+    def test_duplicate_answer_with_padded_text(self):
+        """Test duplicate check runs against the stripped text"""
+        Answer.objects.create(question=self.question, text="Duplicate", is_correct=True)
+
+        data = {
+            "question": self.question.id,
+            "text": "  Duplicate  ",
+            "is_correct": False,
+        }
+        serializer = AnswerSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("text", serializer.errors)
+
+    def test_duplicate_inserted_after_validation(self):
+        """Test a duplicate that slips past validation is reported, not raised"""
+        data = {
+            "question": self.question.id,
+            "text": "Racing",
+            "is_correct": False,
+        }
+        serializer = AnswerSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+        Answer.objects.create(question=self.question, text="Racing", is_correct=True)
+
+        with self.assertRaises(serializers.ValidationError) as ctx:
+            serializer.save()
+        self.assertIn("text", ctx.exception.detail)
+        self.assertEqual(Answer.objects.filter(text="Racing").count(), 1)
+
+    def test_update_with_unchanged_text_skips_uniqueness_query(self):
+        """Test the uniqueness check only runs when text actually changes"""
+        answer = Answer.objects.create(
+            question=self.question, text="Same", is_correct=True
+        )
+        serializer = AnswerUpdateSerializer(
+            answer, data={"text": "Same", "is_correct": False}, partial=True
         )
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.is_valid())
+
+    def test_validation_loads_only_question_id(self):
+        """Test the question lookup does not fetch the whole row"""
+        data = {
+            "question": self.question.id,
+            "text": "Test Answer",
+            "is_correct": True,
+        }
+        serializer = AnswerSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+
+        question = serializer.validated_data["question"]
+        self.assertEqual(question.pk, self.question.pk)
+        self.assertIn("text", question.get_deferred_fields())
+
+    def test_validation_queries(self):
+        """Test validation loads the question and checks uniqueness once"""
+        data = {
+            "question": self.question.id,
+            "text": "Test Answer",
+            "is_correct": True,
+        }
+        serializer = AnswerSerializer(data=data)
+        with self.assertNumQueries(2):
+            self.assertTrue(serializer.is_valid())
 
     def test_student_view_hides_correctness(self):
         """Test student view only shows answer text"""
@@ -248,8 +363,7 @@ class AnswerSerializerTest(TestCase):
             question=self.question, text="Test Answer", is_correct=True
         )
 
-        request_mock = Mock()
-        request_mock.user = self.student
+        request_mock = SimpleNamespace(user=self.student)
 
         serializer = AnswerSerializer(answer, context={"request": request_mock})
         data = serializer.data
@@ -262,18 +376,19 @@ class AnswerSerializerTest(TestCase):
             question=self.question, text="Test Answer", is_correct=True
         )
 
-        view_mock = Mock()
-        view_mock.action = "update"
+        other_question = Question.objects.create(quiz=self.quiz, text="Other")
 
-        serializer = AnswerSerializer(
+        serializer = AnswerUpdateSerializer(
             answer,
-            data={"text": "Updated Answer"},
+            data={"text": "Updated Answer", "question": other_question.id},
             partial=True,
-            context={"view": view_mock},
         )
+        self.assertTrue(serializer.is_valid())
+        serializer.save()
 
-        fields = serializer.get_fields()
-        self.assertTrue(fields["question"].read_only)
+        answer.refresh_from_db()
+        self.assertEqual(answer.question, self.question)
+        self.assertEqual(answer.text, "Updated Answer")
 
     def test_duplicate_answer_validation_with_instance(self):
         """Test validation prevents duplicate answers when updating existing instance"""
@@ -293,78 +408,38 @@ class AnswerSerializerTest(TestCase):
         # Pass instance to trigger the self.instance condition in validate()
         serializer = AnswerSerializer(answer, data=data, partial=True)
         self.assertFalse(serializer.is_valid())
-        self.assertTrue(
-            "text" in serializer.errors or "non_field_errors" in serializer.errors
-        )
+        self.assertEqual(serializer.errors["text"], [DUPLICATE_ANSWER_MESSAGE])
 
-    def test_get_fields_update_action(self):
-        """Test get_fields method for update actions"""
-        answer = Answer.objects.create(
-            question=self.question, text="Test Answer", is_correct=True
-        )
+    def test_update_serializer_question_readonly(self):
+        """Test update serializer makes question read-only"""
+        serializer = AnswerUpdateSerializer()
 
-        view_mock = Mock()
-        view_mock.action = "update"  # Exact match for condition
+        self.assertTrue(serializer.fields["question"].read_only)
 
-        serializer = AnswerSerializer(answer, context={"view": view_mock})
-
-        # lines 84 and 85
-        fields = serializer.get_fields()
-        self.assertTrue(fields["question"].read_only)
+    def test_question_writable_on_create(self):
+        """Test create serializer keeps question writable"""
+        serializer = AnswerSerializer()
 
-    def test_get_fields_partial_update_action(self):
-        """Test get_fields method for partial_update actions"""
-        answer = Answer.objects.create(
-            question=self.question, text="Test Answer", is_correct=True
-        )
+        self.assertFalse(serializer.fields["question"].read_only)
 
-        view_mock = Mock()
-        view_mock.action = "partial_update"
 
-        serializer = AnswerSerializer(answer, context={"view": view_mock})
-
-        # lines 84 and 85
-        fields = serializer.get_fields()
-        self.assertTrue(fields["question"].read_only)
-
-    def test_get_fields_no_view_context(self):
-        """Test get_fields method when no view context is provided"""
-        answer = Answer.objects.create(
-            question=self.question, text="Test Answer", is_correct=True
-        )
-
-        serializer = AnswerSerializer(answer, context={})
-
-        # Should not make question field read-only
-        fields = serializer.get_fields()
-        self.assertFalse(fields["question"].read_only)
-
-
-class QuestionSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
+class QuestionSerializerTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
 
     def test_question_with_answers(self):
         """Test question serializer includes answers"""
         question = Question.objects.create(quiz=self.quiz, text="Test Question")
-        Answer.objects.create(question=question, text="Answer 1", is_correct=True)
-        Answer.objects.create(question=question, text="Answer 2", is_correct=False)
+        Answer.objects.bulk_create(
+            [
+                Answer(question=question, text="Answer 1", is_correct=True),
+                Answer(question=question, text="Answer 2", is_correct=False),
+            ]
+        )
 
-        request_mock = Mock()
-        request_mock.user = self.teacher
+        request_mock = SimpleNamespace(user=self.teacher)
 
         serializer = QuestionSerializer(question, context={"request": request_mock})
         data = serializer.data
@@ -378,17 +453,40 @@ class QuestionSerializerTest(TestCase):
         question = Question.objects.create(
             quiz=self.quiz, text="Test Question", is_written=False
         )
-        Answer.objects.create(question=question, text="Answer 1", is_correct=True)
-        Answer.objects.create(question=question, text="Answer 2", is_correct=False)
+        Answer.objects.bulk_create(
+            [
+                Answer(question=question, text="Answer 1", is_correct=True),
+                Answer(question=question, text="Answer 2", is_correct=False),
+            ]
+        )
 
-        request_mock = Mock()
-        request_mock.user = self.student
+        request_mock = SimpleNamespace(user=self.student)
 
         serializer = QuestionSerializer(question, context={"request": request_mock})
         data = serializer.data
 
         self.assertEqual(data["answers"], ["Answer 1", "Answer 2"])
 
+    def test_role_is_resolved_once_per_serializer(self):
+        """Test the requesting user's role is read once for a list of questions"""
+        for index in range(3):
+            question = Question.objects.create(quiz=self.quiz, text=f"Q{index}")
+            Answer.objects.create(question=question, text="Answer", is_correct=True)
+
+        user = Mock(id=self.student.id)
+        role = PropertyMock(return_value=User.Role.STUDENT)
+        type(user).role = role
+        request_mock = SimpleNamespace(user=user)
+
+        serializer = QuestionSerializer(
+            Question.objects.all(), many=True, context={"request": request_mock}
+        )
+        data = serializer.data
+
+        self.assertEqual([question["answers"] for question in data], [["Answer"]] * 3)
+        # Students get plain answer texts, so no nested serializer resolves it.
+        self.assertEqual(role.call_count, 1)
+
     def test_student_view_hides_answers_for_written(self):
         """Test student view hides answers for written questions"""
         question = Question.objects.create(
@@ -396,8 +494,7 @@ class QuestionSerializerTest(TestCase):
         )
         Answer.objects.create(question=question, text="Answer 1", is_correct=True)
 
-        request_mock = Mock()
-        request_mock.user = self.student
+        request_mock = SimpleNamespace(user=self.student)
 
         serializer = QuestionSerializer(question, context={"request": request_mock})
         data = serializer.data
@@ -410,41 +507,17 @@ class QuestionSerializerTest(TestCase):
         fields = serializer.get_fields()
         self.assertTrue(fields["order"].read_only)
 
-    def test_get_fields_update_action(self):
-        """Test get_fields method for update actions"""
-        question = Question.objects.create(quiz=self.quiz, text="Test Question")
-
-        view_mock = Mock()
-        view_mock.action = "update"
-
-        serializer = QuestionSerializer(question, context={"view": view_mock})
-
-        # lines 123 and 124
-        fields = serializer.get_fields()
-        self.assertTrue(fields["quiz"].read_only)
-
-    def test_get_fields_partial_update_action(self):
-        """Test get_fields method for partial_update actions"""
-        question = Question.objects.create(quiz=self.quiz, text="Test Question")
-
-        view_mock = Mock()
-        view_mock.action = "partial_update"
+    def test_update_serializer_quiz_readonly(self):
+        """Test update serializer makes quiz read-only"""
+        serializer = QuestionUpdateSerializer()
 
-        serializer = QuestionSerializer(question, context={"view": view_mock})
+        self.assertTrue(serializer.fields["quiz"].read_only)
 
-        # lines 123 and 124
-        fields = serializer.get_fields()
-        self.assertTrue(fields["quiz"].read_only)
-
-    def test_get_fields_no_view_context(self):
-        """Test get_fields method when no view context is provided"""
-        question = Question.objects.create(quiz=self.quiz, text="Test Question")
+    def test_quiz_writable_on_create(self):
+        """Test create serializer keeps quiz writable"""
+        serializer = QuestionSerializer()
 
-        serializer = QuestionSerializer(question, context={})
-
-        # Should not make quiz field read-only
-        fields = serializer.get_fields()
-        self.assertFalse(fields["quiz"].read_only)
+        self.assertFalse(serializer.fields["quiz"].read_only)
 
     def test_student_view_written_question_true_condition(self):
         """Test student view for written question with is_written == True"""
@@ -453,8 +526,7 @@ class QuestionSerializerTest(TestCase):
         )
         Answer.objects.create(question=question, text="Answer 1", is_correct=True)
 
-        request_mock = Mock()
-        request_mock.user = self.student
+        request_mock = SimpleNamespace(user=self.student)
 
         serializer = QuestionSerializer(question, context={"request": request_mock})
         data = serializer.data
@@ -464,16 +536,7 @@ class QuestionSerializerTest(TestCase):
         self.assertIsNone(data["answers"])
 
 
-class QuizSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-
+class QuizSerializerTest(ClassroomFixtureTestCase):
     def test_quiz_serialization(self):
         """Test quiz serialization includes all fields"""
         quiz = Quiz.objects.create(
@@ -481,8 +544,12 @@ class QuizSerializerTest(TestCase):
             classroom=self.classroom,
             allowed_attempts=3,
         )
-        Question.objects.create(quiz=quiz, text="Q1")
-        Question.objects.create(quiz=quiz, text="Q2")
+        Question.objects.bulk_create(
+            [
+                Question(quiz=quiz, text="Q1", order=1),
+                Question(quiz=quiz, text="Q2", order=2),
+            ]
+        )
 
         serializer = QuizSerializer(quiz)
         data = serializer.data
@@ -494,74 +561,36 @@ class QuizSerializerTest(TestCase):
 
     def test_classroom_readonly_on_update(self):
         """Test classroom field is read-only on update"""
-        quiz = Quiz.objects.create(title="Test Quiz", classroom=self.classroom)
+        serializer = QuizUpdateSerializer()
 
-        view_mock = Mock()
-        view_mock.action = "update"
-
-        serializer = QuizSerializer(context={"view": view_mock})
-        fields = serializer.get_fields()
-        self.assertTrue(fields["classroom"].read_only)
-
-    def test_get_fields_partial_update_action(self):
-        """Test get_fields method for partial_update actions"""
-        quiz = Quiz.objects.create(title="Test Quiz", classroom=self.classroom)
-
-        view_mock = Mock()
-        view_mock.action = "partial_update"
-
-        serializer = QuizSerializer(quiz, context={"view": view_mock})
-
-        # lines 164 and 165
-        fields = serializer.get_fields()
-        self.assertTrue(fields["classroom"].read_only)
+        self.assertTrue(serializer.fields["classroom"].read_only)
 
-    def test_get_fields_update_action_with_instance(self):
-        """Test get_fields method for update actions with instance"""
-        quiz = Quiz.objects.create(title="Test Quiz", classroom=self.classroom)
+    def test_classroom_writable_on_create(self):
+        """Test create serializer keeps classroom writable"""
+        serializer = QuizSerializer()
 
-        view_mock = Mock()
-        view_mock.action = "update"
-
-        serializer = QuizSerializer(quiz, context={"view": view_mock})
-
-        # lines 164 and 165
-        fields = serializer.get_fields()
-        self.assertTrue(fields["classroom"].read_only)
+        self.assertFalse(serializer.fields["classroom"].read_only)
 
     def test_get_fields_no_view_context(self):
         """Test get_fields method when no view context is provided"""
-        quiz = Quiz.objects.create(title="Test Quiz", classroom=self.classroom)
-
-        serializer = QuizSerializer(quiz, context={})
+        serializer = QuizSerializer(context={})
 
         # Should not make classroom field read-only
         fields = serializer.get_fields()
         self.assertFalse(fields["classroom"].read_only)
 
 
-class StudentAnswerSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
+class StudentAnswerSerializerTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        cls.question = Question.objects.create(quiz=cls.quiz, text="Test Question")
+        cls.quiz_attempt = StudentQuizAttempt.objects.create(
+            student=cls.student, quiz=cls.quiz
         )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(quiz=self.quiz, text="Test Question")
-        self.quiz_attempt = StudentQuizAttempt.objects.create(
-            student=self.student, quiz=self.quiz
-        )
-        self.question_attempt = StudentQuestionAttempt.objects.create(
-            quiz_attempt=self.quiz_attempt, question=self.question
+        cls.question_attempt = StudentQuestionAttempt.objects.create(
+            quiz_attempt=cls.quiz_attempt, question=cls.question
         )
 
     def test_serializer_fields(self):
@@ -588,7 +617,7 @@ class StudentAnswerSerializerTest(TestCase):
         self.assertIn("is_correct", serializer.Meta.read_only_fields)
 
 
-class StudentAnswersSubmitSerializerTest(TestCase):
+class StudentAnswersSubmitSerializerTest(SimpleTestCase):
     def test_valid_data(self):
         """Test valid answer submission data"""
         data = {
@@ -613,38 +642,73 @@ class StudentAnswersSubmitSerializerTest(TestCase):
         serializer = StudentAnswersSubmitSerializer(data=data)
         self.assertFalse(serializer.is_valid())
 
+
+class StudentAnswersSubmitSerializerCreateTest(TestCase):
     def test_create_method(self):
-        """Test create method returns None (placeholder implementation)"""
+        """Test create bulk-inserts answers with correctness precomputed"""
+        student = create_student()
+        quiz = create_quiz()
+        question = create_question(
+            quiz, text="Pick the primes", has_multiple_answers=True
+        )
+        Answer.objects.create(question=question, text="2", is_correct=True)
+        Answer.objects.create(question=question, text="4", is_correct=False)
+        quiz_attempt = StudentQuizAttempt.objects.create(student=student, quiz=quiz)
+        question_attempt = StudentQuestionAttempt.objects.create(
+            quiz_attempt=quiz_attempt, question=question, submitted_at=timezone.now()
+        )
+
         data = {
-            "question_attempt": 1,
-            "answers": ["Answer 1", "Answer 2"],
+            "question_attempt": question_attempt.id,
+            "answers": ["2", "4", "2"],
         }
         serializer = StudentAnswersSubmitSerializer(data=data)
         self.assertTrue(serializer.is_valid())
-        # The create method currently just contains 'pass', so it returns None
-        result = serializer.create(serializer.validated_data)
-        self.assertIsNone(result)
+        serializer.save(question_attempt=question_attempt)
 
+        answers = StudentAnswer.objects.filter(question_attempt=question_attempt)
+        self.assertEqual(
+            sorted(answers.values_list("text", "is_correct")),
+            [("2", True), ("4", False)],
+        )
 
-class StudentQuestionAttemptSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
+    def test_create_stores_repeated_answers_once(self):
+        """Test answers equal once stripped are stored as a single row"""
+        student = create_student()
+        question = create_question(create_quiz(), has_multiple_answers=True)
+        Answer.objects.create(question=question, text="Paris", is_correct=True)
+        quiz_attempt = StudentQuizAttempt.objects.create(
+            student=student, quiz=question.quiz
         )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
+        question_attempt = StudentQuestionAttempt.objects.create(
+            quiz_attempt=quiz_attempt, question=question, submitted_at=timezone.now()
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(quiz=self.quiz, text="Test Question")
-        self.quiz_attempt = StudentQuizAttempt.objects.create(
-            student=self.student, quiz=self.quiz
+
+        serializer = StudentAnswersSubmitSerializer(
+            data={
+                "question_attempt": question_attempt.id,
+                "answers": ["Paris", " Paris", "paris"],
+            }
+        )
+        self.assertTrue(serializer.is_valid())
+        created = serializer.save(question_attempt=question_attempt)
+
+        self.assertEqual(len(created), 2)
+        answers = StudentAnswer.objects.filter(question_attempt=question_attempt)
+        self.assertEqual(
+            sorted(answers.values_list("text", "is_correct")),
+            [("Paris", True), ("paris", True)],
+        )
+
+
+class StudentQuestionAttemptSerializerTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        cls.question = Question.objects.create(quiz=cls.quiz, text="Test Question")
+        cls.quiz_attempt = StudentQuizAttempt.objects.create(
+            student=cls.student, quiz=cls.quiz
         )
 
     def test_serializer_includes_nested_data(self):
@@ -659,8 +723,7 @@ class StudentQuestionAttemptSerializerTest(TestCase):
             question_attempt=question_attempt, text="Test Answer"
         )
 
-        request_mock = Mock()
-        request_mock.user = self.teacher
+        request_mock = SimpleNamespace(user=self.teacher)
 
         serializer = StudentQuestionAttemptSerializer(
             question_attempt, context={"request": request_mock}
@@ -671,23 +734,25 @@ class StudentQuestionAttemptSerializerTest(TestCase):
         self.assertIn("student_answers", data)
         self.assertEqual(len(data["student_answers"]), 1)
 
-
-class StudentQuizAttemptSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
+    def test_question_is_summarized_without_answers(self):
+        """Test nested question omits its answer options"""
+        Answer.objects.create(question=self.question, text="Option", is_correct=True)
+        question_attempt = StudentQuestionAttempt.objects.create(
+            quiz_attempt=self.quiz_attempt, question=self.question
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
+
+        data = StudentQuestionAttemptSerializer(question_attempt).data
+
+        self.assertEqual(data["question"]["id"], self.question.id)
+        self.assertEqual(data["question"]["text"], "Test Question")
+        self.assertNotIn("answers", data["question"])
+
+
+class StudentQuizAttemptSerializerTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
 
     def test_readonly_fields(self):
         """Test that certain fields are read-only"""
@@ -711,25 +776,33 @@ class StudentQuizAttemptSerializerTest(TestCase):
         self.assertEqual(data["quiz"], self.quiz.id)
         self.assertEqual(float(data["score"]), 85.50)
 
+    def test_setup_queryset_avoids_per_row_quiz_queries(self):
+        """Test setup_queryset loads quiz names with the attempts"""
+        other_quiz = Quiz.objects.create(title="Quiz 2", classroom=self.classroom)
+        StudentQuizAttempt.objects.create(student=self.student, quiz=self.quiz)
+        StudentQuizAttempt.objects.create(student=self.student, quiz=other_quiz)
 
-class SQANextQuestionSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
+        queryset = StudentQuizAttemptSerializer.setup_queryset(
+            StudentQuizAttempt.objects.order_by("id")
         )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
+        with self.assertNumQueries(1):
+            data = StudentQuizAttemptSerializer(queryset, many=True).data
+
+        self.assertEqual([row["quiz_name"] for row in data], ["Quiz 1", "Quiz 2"])
+
+
+class SQANextQuestionSerializerTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student()
+        # Order is set explicitly so bulk_create can skip Question.save().
+        cls.question1, cls.question2 = Question.objects.bulk_create(
+            [
+                Question(quiz=cls.quiz, text="Question 1", order=1),
+                Question(quiz=cls.quiz, text="Question 2", order=2),
+            ]
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question1 = Question.objects.create(quiz=self.quiz, text="Question 1")
-        self.question2 = Question.objects.create(quiz=self.quiz, text="Question 2")
 
     def test_next_question_serialization(self):
         """Test serialization of next question"""
@@ -737,8 +810,7 @@ class SQANextQuestionSerializerTest(TestCase):
             student=self.student, quiz=self.quiz
         )
 
-        request_mock = Mock()
-        request_mock.user = self.student
+        request_mock = SimpleNamespace(user=self.student)
 
         serializer = SQANextQuestionSerializer(
             attempt, context={"request": request_mock}
@@ -750,6 +822,49 @@ class SQANextQuestionSerializerTest(TestCase):
         self.assertIsNotNone(data["next_question"])
         self.assertIsNotNone(data["question_attempt"])
 
+    def test_many_attempts_each_get_their_own_next_question(self):
+        """Test the per-serializer cache does not leak between attempts"""
+        other_student = create_student("other")
+        first = StudentQuizAttempt.objects.create(student=self.student, quiz=self.quiz)
+        second = StudentQuizAttempt.objects.create(
+            student=other_student, quiz=self.quiz
+        )
+        answered = StudentQuestionAttempt.objects.create(
+            quiz_attempt=second, question=self.question1, submitted_at=timezone.now()
+        )
+
+        request_mock = SimpleNamespace(user=self.student)
+        data = SQANextQuestionSerializer(
+            [first, second], many=True, context={"request": request_mock}
+        ).data
+
+        self.assertEqual(data[0]["next_question"]["id"], self.question1.id)
+        self.assertEqual(data[1]["next_question"]["id"], self.question2.id)
+        self.assertNotEqual(data[0]["question_attempt"], data[1]["question_attempt"])
+        self.assertNotEqual(data[1]["question_attempt"], answered.id)
+
+    def test_shared_next_question_is_rendered_once(self):
+        """Test attempts landing on the same question reuse its rendered data"""
+        other_student = create_student("other")
+        attempts = [
+            StudentQuizAttempt.objects.create(student=self.student, quiz=self.quiz),
+            StudentQuizAttempt.objects.create(student=other_student, quiz=self.quiz),
+        ]
+
+        request_mock = SimpleNamespace(user=self.student)
+        with patch.object(
+            QuestionSerializer,
+            "to_representation",
+            autospec=True,
+            side_effect=QuestionSerializer.to_representation,
+        ) as render:
+            data = SQANextQuestionSerializer(
+                attempts, many=True, context={"request": request_mock}
+            ).data
+
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(data[0]["next_question"], data[1]["next_question"])
+
     def test_no_next_question(self):
         """Test when no next question is available"""
         attempt = StudentQuizAttempt.objects.create(
@@ -757,12 +872,15 @@ class SQANextQuestionSerializerTest(TestCase):
         )
 
         # Complete all questions
-        for question in [self.question1, self.question2]:
-            question_attempt = StudentQuestionAttempt.objects.create(
-                quiz_attempt=attempt, question=question
-            )
-            question_attempt.submitted_at = timezone.now()
-            question_attempt.save()
+        now = timezone.now()
+        StudentQuestionAttempt.objects.bulk_create(
+            [
+                StudentQuestionAttempt(
+                    quiz_attempt=attempt, question=question, submitted_at=now
+                )
+                for question in [self.question1, self.question2]
+            ]
+        )
 
         serializer = SQANextQuestionSerializer(attempt)
         data = serializer.data
@@ -770,22 +888,34 @@ class SQANextQuestionSerializerTest(TestCase):
         self.assertIsNone(data["next_question"])
         self.assertIsNone(data["question_attempt"])
 
+    def test_no_next_question_is_looked_up_once(self):
+        """Test a finished attempt looks up the next question only once"""
+        attempt = StudentQuizAttempt.objects.create(
+            student=self.student, quiz=self.quiz
+        )
+        for question in [self.question1, self.question2]:
+            StudentQuestionAttempt.objects.create(
+                quiz_attempt=attempt, question=question, submitted_at=timezone.now()
+            )
 
-class EnrollmentCodeSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
+        serializer = SQANextQuestionSerializer(attempt)
+        with self.assertNumQueries(1):
+            data = serializer.data
+
+        self.assertIsNone(data["next_question"])
+
+
+class EnrollmentCodeSerializerTest(ClassroomFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.code = EnrollmentCode.objects.create(
+            code="TEST1234", classroom=cls.classroom, is_active=True
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
 
     def test_serializer_readonly_fields(self):
         """Test that code and classroom are read-only"""
-        code = EnrollmentCode.objects.create(code="TEST1234", classroom=self.classroom)
-
-        serializer = EnrollmentCodeSerializer(code)
+        serializer = EnrollmentCodeSerializer()
         fields = serializer.get_fields()
 
         self.assertTrue(fields["code"].read_only)
@@ -793,11 +923,7 @@ class EnrollmentCodeSerializerTest(TestCase):
 
     def test_serialization(self):
         """Test enrollment code serialization"""
-        code = EnrollmentCode.objects.create(
-            code="TEST1234", classroom=self.classroom, is_active=True
-        )
-
-        serializer = EnrollmentCodeSerializer(code)
+        serializer = EnrollmentCodeSerializer(self.code)
         data = serializer.data
 
         self.assertEqual(data["code"], "TEST1234")
@@ -805,15 +931,13 @@ class EnrollmentCodeSerializerTest(TestCase):
         self.assertTrue(data["is_active"])
 
 
-class EnrollmentCodePutSerializerTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
+class EnrollmentCodePutSerializerTest(ClassroomFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.code = EnrollmentCode.objects.create(
+            code="OLD1234", classroom=cls.classroom, is_active=False
         )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
 
     def test_all_fields_readonly(self):
         """Test that all fields are read-only"""
@@ -826,9 +950,7 @@ class EnrollmentCodePutSerializerTest(TestCase):
 
     def test_save_method(self):
         """Test custom save method generates new code and sets active"""
-        code = EnrollmentCode.objects.create(
-            code="OLD1234", classroom=self.classroom, is_active=False
-        )
+        code = self.code
         original_code_text = code.code
 
         serializer = EnrollmentCodePutSerializer(code, data={})
@@ -842,14 +964,14 @@ class EnrollmentCodePutSerializerTest(TestCase):
         self.assertEqual(len(saved_instance.code), 8)
 
         # Verify that the generate_for_class was called by checking the database
-        updated_code = EnrollmentCode.objects.get(id=code.id)
-        self.assertTrue(updated_code.is_active)
+        is_active = EnrollmentCode.objects.values_list("is_active", flat=True).get(
+            id=code.id
+        )
+        self.assertTrue(is_active)
 
     def test_save_method_generates_new_code(self):
         """Test that save method calls generate_for_class and sets instance correctly"""
-        code = EnrollmentCode.objects.create(
-            code="INITIAL1", classroom=self.classroom, is_active=False
-        )
+        code = self.code
 
         serializer = EnrollmentCodePutSerializer(code, data={})
         self.assertTrue(serializer.is_valid())
@@ -868,7 +990,7 @@ class EnrollmentCodePutSerializerTest(TestCase):
             self.assertTrue(serializer.instance.is_active)
 
 
-class EnrollSerializerTest(TestCase):
+class EnrollSerializerTest(SimpleTestCase):
     def test_valid_code(self):
         """Test valid enrollment code"""
         data = {"code": "VALID123"}
@@ -883,24 +1005,12 @@ class EnrollSerializerTest(TestCase):
         self.assertIn("code", serializer.errors)
 
 
-class TeacherStatsSerializersTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            first_name="John",
-            last_name="Doe",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.classroom = Classroom.objects.create(name="Math", teacher=self.teacher)
-        self.quiz = Quiz.objects.create(title="Quiz 1", classroom=self.classroom)
-        self.question = Question.objects.create(quiz=self.quiz, text="Test Question")
+class TeacherStatsSerializersTest(QuizFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = create_student(first_name="John", last_name="Doe")
+        cls.question = create_question(cls.quiz)
 
     def test_teacher_student_quiz_attempt_stats(self):
         """Test teacher quiz attempt stats serializer"""
@@ -931,8 +1041,7 @@ class TeacherStatsSerializersTest(TestCase):
             question_attempt=question_attempt, text="Test Answer"
         )
 
-        request_mock = Mock()
-        request_mock.user = self.teacher
+        request_mock = SimpleNamespace(user=self.teacher)
 
         serializer = TeacherStudentQuestionAttemptStatsSerializer(
             question_attempt, context={"request": request_mock}
@@ -945,132 +1054,167 @@ class TeacherStatsSerializersTest(TestCase):
         self.assertIn("started_at", data)
         self.assertIn("submitted_at", data)
 
+    def test_question_attempt_stats_queries(self):
+        """Test question attempt stats use a fixed number of queries"""
+        quiz_attempt = StudentQuizAttempt.objects.create(
+            student=self.student, quiz=self.quiz
+        )
+        question2 = Question.objects.create(quiz=self.quiz, text="Question 2")
+        now = timezone.now()
+        question_attempts = StudentQuestionAttempt.objects.bulk_create(
+            [
+                StudentQuestionAttempt(
+                    quiz_attempt=quiz_attempt, question=question, submitted_at=now
+                )
+                for question in [self.question, question2]
+            ]
+        )
+        for question_attempt in question_attempts:
+            StudentAnswer.objects.create(
+                question_attempt=question_attempt, text="Test Answer"
+            )
+
+        queryset = TeacherStudentQuestionAttemptStatsSerializer.setup_queryset(
+            StudentQuestionAttempt.objects.filter(quiz_attempt=quiz_attempt)
+        )
+        serializer = TeacherStudentQuestionAttemptStatsSerializer(
+            queryset,
+            many=True,
+            context={"request": SimpleNamespace(user=self.teacher)},
+        )
+        # Attempts with their questions, question answers, student answers.
+        with self.assertNumQueries(3):
+            data = serializer.data
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual([len(row["student_answers"]) for row in data], [1, 1])
+
 
 # ======================== VIEW TESTS ========================
 
 
 class ActivateUserViewTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_student(is_active=False)
+
     def setUp(self):
         self.client = APIClient()
-        self.url = reverse(
-            "activate_user", kwargs={"uidb64": "test_uid", "token": "test_token"}
+
+    def activation_url(self, uidb64=None, token=None):
+        return reverse(
+            "activate_user",
+            kwargs={
+                "uidb64": uidb64 or encode_uid(self.user.pk),
+                "token": token or default_token_generator.make_token(self.user),
+            },
         )
 
-    @patch("base.views.requests.post")
-    def test_successful_activation(self, mock_post):
+    def test_successful_activation(self):
         """Test successful user activation"""
-        mock_response = Mock()
-        mock_response.status_code = 204
-        mock_post.return_value = mock_response
-
-        response = self.client.get(self.url)
+        response = self.client.get(self.activation_url())
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn("detail", response.data)
         self.assertEqual(response.data["detail"], "User activated successfilly")
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_active)
 
-    @patch("base.views.requests.post")
-    def test_activation_failure_with_json_response(self, mock_post):
-        """Test activation failure with JSON error response"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"error": "Invalid token"}
-        mock_post.return_value = mock_response
+    def test_activation_sends_user_activated_signal(self):
+        """Test activation notifies djoser's user_activated receivers"""
+        receiver = Mock()
+        user_activated.connect(receiver)
+        self.addCleanup(user_activated.disconnect, receiver)
 
-        response = self.client.get(self.url)
+        self.client.get(self.activation_url())
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn("error", response.data)
+        receiver.assert_called_once()
+        self.assertEqual(receiver.call_args.kwargs["user"], self.user)
+
+    def test_activation_ignores_credentials(self):
+        """Test a stale Authorization header does not block activation"""
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-jwt")
+
+        response = self.client.get(self.activation_url())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_token(self):
+        """Test activation with an invalid token"""
+        response = self.client.get(self.activation_url(token="invalid-token"))
 
-    @patch("base.views.requests.post")
-    def test_activation_failure_without_json_response(self, mock_post):
-        """Test activation failure without JSON response"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.side_effect = ValueError("No JSON")
-        mock_post.return_value = mock_response
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.data)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
 
-        response = self.client.get(self.url)
+    def test_invalid_uid(self):
+        """Test activation with a uid that matches no user"""
+        response = self.client.get(self.activation_url(uidb64="invalid"))
 
-        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("error", response.data)
 
-    @patch("base.views.requests.post")
-    def test_request_exception(self, mock_post):
-        """Test handling of request exceptions"""
-        mock_post.side_effect = requests.RequestException("Network error")
+    def test_already_active_user(self):
+        """Test activating an already active user is rejected"""
+        url = self.activation_url()
+        self.client.get(url)
 
-        response = self.client.get(self.url)
+        response = self.client.get(url)
 
-        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertIn("error", response.data)
-        self.assertEqual(response.data["error"], "Network error")
 
 
 # ======================== PERMISSION TESTS ========================
 
 
 class PermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = create_teacher()
+        cls.student = create_student()
+
     def setUp(self):
-        self.teacher = User.objects.create_user(
-            username="teacher",
-            email="teacher@example.com",
-            password="pass",
-            role=User.Role.TEACHER,
-        )
-        self.student = User.objects.create_user(
-            username="student",
-            email="student@example.com",
-            password="pass",
-            role=User.Role.STUDENT,
-        )
-        self.anonymous_user = Mock()
-        self.anonymous_user.is_authenticated = False
+        self.anonymous_user = SimpleNamespace(is_authenticated=False)
 
     def test_is_teacher_permission_with_teacher(self):
         """Test IsTeacher permission with teacher user"""
         permission = IsTeacher()
-        request = Mock()
-        request.user = self.teacher
+        request = SimpleNamespace(user=self.teacher)
 
         self.assertTrue(permission.has_permission(request, None))
 
     def test_is_teacher_permission_with_student(self):
         """Test IsTeacher permission with student user"""
         permission = IsTeacher()
-        request = Mock()
-        request.user = self.student
+        request = SimpleNamespace(user=self.student)
 
         self.assertFalse(permission.has_permission(request, None))
 
     def test_is_teacher_permission_with_anonymous(self):
         """Test IsTeacher permission with anonymous user"""
         permission = IsTeacher()
-        request = Mock()
-        request.user = self.anonymous_user
+        request = SimpleNamespace(user=self.anonymous_user)
 
         self.assertFalse(permission.has_permission(request, None))
 
     def test_is_student_permission_with_student(self):
         """Test IsStudent permission with student user"""
         permission = IsStudent()
-        request = Mock()
-        request.user = self.student
+        request = SimpleNamespace(user=self.student)
 
         self.assertTrue(permission.has_permission(request, None))
 
     def test_is_student_permission_with_teacher(self):
         """Test IsStudent permission with teacher user"""
         permission = IsStudent()
-        request = Mock()
-        request.user = self.teacher
+        request = SimpleNamespace(user=self.teacher)
 
         self.assertFalse(permission.has_permission(request, None))
 
     def test_is_student_permission_with_anonymous(self):
         """Test IsStudent permission with anonymous user"""
         permission = IsStudent()
-        request = Mock()
-        request.user = self.anonymous_user
+        request = SimpleNamespace(user=self.anonymous_user)
 
         self.assertFalse(permission.has_permission(request, None))
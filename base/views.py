@@ -1,46 +1,70 @@
-import requests
+from djoser import signals
+from djoser.compat import get_user_email
+from djoser.conf import settings as djoser_settings
+from djoser.views import UserViewSet
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
-from rest_framework import status
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.permissions import AllowAny
+from rest_framework import exceptions, status
 from drf_spectacular.utils import extend_schema
 
 from rest_framework import serializers
 
 
-# Serializer for the response
+# Documents the response shape for the schema; responses are plain dicts.
 class ActivateUserResponseSerializer(serializers.Serializer):
     detail = serializers.CharField(required=False)
     error = serializers.CharField(required=False)
 
 
+def _first_error(detail):
+    """Flatten a DRF error detail down to its first message."""
+    if isinstance(detail, dict):
+        detail = next(iter(detail.values()))
+    if isinstance(detail, list):
+        detail = detail[0]
+    return str(detail)
+
+
 # Create your views here.
 @extend_schema(
     summary="Activate User Account",
-    responses={200: ActivateUserResponseSerializer},
+    responses={
+        200: ActivateUserResponseSerializer,
+        400: ActivateUserResponseSerializer,
+        403: ActivateUserResponseSerializer,
+    },
     tags=["Authentication"],
 )
 @api_view(["GET"])
+@authentication_classes([])
+@permission_classes([AllowAny])
 def activate_user(request, uidb64, token):
-    base_url = request.build_absolute_uri("/").rstrip("/")
-    internal_url = f"{base_url}/auth/users/activation/"
-    payload = {"uid": uidb64, "token": token}
+    # Runs djoser's activation in-process instead of POSTing to
+    # /auth/users/activation/ on ourselves. The serializer reads
+    # token_generator from the view, so djoser's UserViewSet is passed.
+    serializer = djoser_settings.SERIALIZERS.activation(
+        data={"uid": uidb64, "token": token},
+        context={"request": request, "view": UserViewSet},
+    )
     try:
-        internal_response = requests.post(internal_url, json=payload)
-        if internal_response.status_code == 204:
-            response_data = {"detail": "User activated successfilly"}
-            serializer = ActivateUserResponseSerializer(data=response_data)
-            serializer.is_valid(raise_exception=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        else:
-            try:
-                data = internal_response.json()
-            except ValueError:
-                data = {"error": "Internal error occurred while activating the user."}
-            serializer = ActivateUserResponseSerializer(data=data)
-            serializer.is_valid(raise_exception=True)
-            return Response(serializer.data, status=internal_response.status_code)
-    except requests.RequestException as e:
-        response_data = {"error": str(e)}
-        serializer = ActivateUserResponseSerializer(data=response_data)
         serializer.is_valid(raise_exception=True)
-        return Response(serializer.data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    except exceptions.APIException as e:
+        return Response({"error": _first_error(e.detail)}, status=e.status_code)
+
+    user = serializer.user
+    user.is_active = True
+    user.save(update_fields=["is_active"])
+    signals.user_activated.send(sender=UserViewSet, user=user, request=request)
+    if djoser_settings.SEND_CONFIRMATION_EMAIL:
+        djoser_settings.EMAIL.confirmation(request, {"user": user}).send(
+            [get_user_email(user)]
+        )
+
+    return Response(
+        {"detail": "User activated successfilly"}, status=status.HTTP_200_OK
+    )
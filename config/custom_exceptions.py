@@ -3,15 +3,23 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework import status
 
+# Friendlier wording for DRF's built-in non-field validation messages.
+ERROR_MESSAGES = {
+    "The fields question, text must make a unique set.": (
+        "This answer already exists for this question."
+    ),
+}
+
 
 def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
 
     if isinstance(exc, ValidationError):
-        error_message = exc.detail.get("non_field_errors", [""])[0]
+        error_message = ""
+        if isinstance(exc.detail, dict):
+            error_message = exc.detail.get("non_field_errors", [""])[0]
 
-        if error_message == "The fields question, text must make a unique set.":
-            error_message = "This answer already exists for this question."
+        error_message = ERROR_MESSAGES.get(error_message, error_message)
         return Response(
             {
                 "detail": error_message,
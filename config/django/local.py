@@ -8,41 +8,36 @@ SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"] = timedelta(days=1)
 # SILKY_AUTHORISATION = True
 
 
+# Ignore paths that start with these patterns
+SILK_IGNORE_PREFIXES = (
+    "/admin/",
+    "/static/",
+    "/media/",
+    "/silk/",
+)
+
+# Ignore specific files
+SILK_IGNORE_FILES = frozenset(
+    {
+        "/favicon.ico",
+        "/robots.txt",
+    }
+)
+
+
 # Use SILKY_INTERCEPT_FUNC for pattern-based path ignoring (supports wildcards)
 def should_intercept_request(request):
     """
     Return True if the request should be profiled, False to ignore it.
     """
     path = request.path_info
-
-    # Ignore paths that start with these patterns
-    ignore_patterns = [
-        "/admin/",
-        "/static/",
-        "/media/",
-        "/silk/",
-    ]
-
-    # Ignore specific files
-    ignore_files = [
-        "/favicon.ico",
-        "/robots.txt",
-    ]
-
-    # Check if path starts with any ignore pattern
-    for pattern in ignore_patterns:
-        if path.startswith(pattern):
-            return False
-
-    # Check if path matches any ignore file
-    if path in ignore_files:
-        return False
-
-    return True
+    return not (path.startswith(SILK_IGNORE_PREFIXES) or path in SILK_IGNORE_FILES)
 
 
 SILKY_INTERCEPT_FUNC = should_intercept_request
 
-INSTALLED_APPS += ["silk"]
+# Set DJANGO_SILK=False to run the dev server without the profiler
+if env.bool("DJANGO_SILK", default=True):
+    INSTALLED_APPS += ["silk"]
 
-MIDDLEWARE += ["silk.middleware.SilkyMiddleware"]
+    MIDDLEWARE += ["silk.middleware.SilkyMiddleware"]
@@ -20,10 +20,19 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 # Enable on proxy only
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
-REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("rest_framework.renderers.JSONRenderer",)
+# Reuse database connections across requests instead of reconnecting each time
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DJANGO_CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("config.renderers.ORJSONRenderer",)
+REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+    "config.renderers.ORJSONParser",
+    "rest_framework.parsers.FormParser",
+    "rest_framework.parsers.MultiPartParser",
+)
 
 # For error reporting, DJANGO_ADMINS=Blake:blake@cyb.org,Alice:alice@cyb.org
-ADMINS = [x.split(":") for x in env.list("DJANGO_ADMINS", default=[])]
+ADMINS = [tuple(x.split(":", 1)) for x in env.list("DJANGO_ADMINS", default=[])]
 
 
 STATIC_URL = env.str("DJANGO_STATIC_URL", "/static/")
@@ -1 +1,9 @@
 from .base import *
+
+# PBKDF2 is deliberately slow; tests create many users and never need real
+# password security.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Run tests against in-memory SQLite unless TEST_DATABASE_URL points at a real
+# server, so a DATABASE_URL meant for development is never used by the suite.
+DATABASES = {"default": env.db("TEST_DATABASE_URL", default="sqlite://:memory:")}
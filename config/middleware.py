@@ -1,12 +1,14 @@
+from django.conf import settings
 from django.http import Http404
 
 
 class StaffOnlyAdminMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        self.admin_prefix = f"/{settings.ADMIN_URL}"
 
     def __call__(self, request):
-        if request.path.startswith("/admin/"):
+        if request.path.startswith(self.admin_prefix):
             if not (request.user.is_authenticated and request.user.is_staff):
                 raise Http404("Page not found")
 
@@ -0,0 +1,34 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    Dates, times and types orjson does not handle natively (Decimal, lazy
+    translation strings, ...) go through DRF's JSONEncoder, so they render as
+    JSONRenderer renders them. Unlike JSONRenderer, NaN and infinity render as
+    null instead of raising, and the ``indent`` media type parameter is ignored.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser backed by orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,60 @@
+import io
+import json
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from ..renderers import ORJSONParser, ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def assertRendersLikeDRF(self, data):
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(data)),
+            json.loads(JSONRenderer().render(data)),
+        )
+
+    def test_decimal(self):
+        """Test Decimal renders the same as DRF's renderer"""
+        self.assertRendersLikeDRF({"score": Decimal("87.50")})
+
+    def test_lazy_string(self):
+        """Test lazy translation strings render the same as DRF's renderer"""
+        self.assertRendersLikeDRF({"detail": gettext_lazy("Not found.")})
+
+    def test_datetime(self):
+        """Test aware UTC datetimes keep DRF's Z suffix"""
+        data = {"started_at": datetime(2025, 1, 2, 3, 4, 5, 678901, dt_timezone.utc)}
+
+        self.assertRendersLikeDRF(data)
+        self.assertIn(b"Z", ORJSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        """Test None renders an empty body like DRF's renderer"""
+        self.assertEqual(ORJSONRenderer().render(None), JSONRenderer().render(None))
+
+
+class ORJSONParserTest(SimpleTestCase):
+    def test_parses_like_drf(self):
+        """Test a valid body parses to the same data as DRF's parser"""
+        body = b'{"answers": ["4", "four"], "question_attempt": 1}'
+
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_malformed_body(self):
+        """Test a malformed body raises ParseError like DRF's parser"""
+        body = b'{"answers": ['
+
+        for parser in (JSONParser(), ORJSONParser()):
+            with self.subTest(parser=type(parser).__name__):
+                with self.assertRaises(ParseError) as cm:
+                    parser.parse(io.BytesIO(body))
+                self.assertTrue(str(cm.exception.detail).startswith("JSON parse error"))
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 """Django's command-line utility for administrative tasks."""
+
 import os
 import sys
 
 
 def main():
     """Run administrative tasks."""
+    if len(sys.argv) > 1 and sys.argv[1] == "test":
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django.test")
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django.local")
     try:
         from django.core.management import execute_from_command_line